@@ -2,12 +2,25 @@
 API Dependencies - Shared resources and dependency injection
 """
 
+import json
 from functools import lru_cache
+from typing import Any, Callable, Dict, Tuple
+from fastapi import Response
 from backend.core import Manager
 
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+except ImportError:
+    def _json_dumps(data: Any) -> bytes:
+        return json.dumps(data).encode()
+
 # Global manager instance
 _manager = None
 
+# Encoded catalog responses: name -> (catalog version, JSON body)
+_catalog_responses: Dict[str, Tuple[int, bytes]] = {}
+
 
 def get_manager() -> Manager:
     """Get the global manager instance"""
@@ -27,4 +40,15 @@ async def initialize_manager():
 async def shutdown_manager():
     """Shutdown the manager on app shutdown"""
     manager = get_manager()
-    await manager.stop()
\ No newline at end of file
+    await manager.stop()
+
+
+def catalog_json_response(name: str, build: Callable[[Manager], Any]) -> Response:
+    """Serve a catalog view as JSON, re-encoding only after the plugin catalog changes"""
+    manager = get_manager()
+    version = manager.get_catalog_version()
+    cached = _catalog_responses.get(name)
+    if cached is None or cached[0] != version:
+        cached = (version, _json_dumps(build(manager)))
+        _catalog_responses[name] = cached
+    return Response(content=cached[1], media_type="application/json")
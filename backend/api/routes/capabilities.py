@@ -5,7 +5,7 @@ Capabilities API Routes
 from fastapi import APIRouter, HTTPException
 from typing import Dict, Any, List
 
-from backend.api.dependencies import get_manager
+from backend.api.dependencies import get_manager, catalog_json_response
 
 router = APIRouter(prefix="/api/capabilities", tags=["capabilities"])
 
@@ -13,9 +13,7 @@ router = APIRouter(prefix="/api/capabilities", tags=["capabilities"])
 @router.get("/")
 async def list_capabilities():
     """List all available capabilities"""
-    manager = get_manager()
-    capabilities = manager.list_capabilities()
-    return {"capabilities": capabilities}
+    return catalog_json_response("capabilities", lambda manager: {"capabilities": manager.list_capabilities()})
 
 
 @router.get("/{capability}")
@@ -9,7 +9,7 @@ import tempfile
 import os
 from pathlib import Path
 
-from backend.api.dependencies import get_manager
+from backend.api.dependencies import get_manager, catalog_json_response
 
 logger = logging.getLogger(__name__)
 
@@ -19,9 +19,7 @@ router = APIRouter(prefix="/api/plugins", tags=["plugins"])
 @router.get("/")
 async def list_plugins():
     """List all loaded plugins with their capabilities"""
-    manager = get_manager()
-    plugins = manager.list_plugins()
-    return {"plugins": plugins}
+    return catalog_json_response("plugins", lambda manager: {"plugins": manager.list_plugins()})
 
 
 @router.get("/{plugin_id}")
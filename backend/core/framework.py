@@ -4,7 +4,8 @@ Core Plugin Framework - Zero hardcoded concepts, maximum flexibility
 
 import logging
 import asyncio
-from typing import Dict, Any, List, Optional, Callable, Union
+import hashlib
+from typing import Dict, Any, List, Optional, Callable, Union, Tuple
 from abc import ABC, abstractmethod
 import inspect
 from datetime import datetime
@@ -102,6 +103,7 @@ class Framework:
     def __init__(self):
         self.plugins: Dict[str, Plugin] = {}
         self.global_capabilities: Dict[str, List[str]] = {}  # capability_name -> plugin_ids
+        self.capability_providers: Dict[str, List[Dict[str, Any]]] = {}  # capability_name -> provider info
         self.event_bus = {}
         self.middleware_stack: List[Callable] = []
         self.running = False
@@ -109,11 +111,14 @@ class Framework:
         
         # Advanced features
         self.plugin_dependencies: Dict[str, List[str]] = {}  # plugin_id -> dependencies
-        self.capability_cache: Dict[str, Any] = {}  # Performance caching
+        self.capability_cache: Dict[Tuple[str, Optional[str], bytes], Any] = {}  # Performance caching
         self.error_handlers: Dict[str, Callable] = {}  # Error recovery
         self.metrics: Dict[str, Any] = {"calls": 0, "errors": 0, "cache_hits": 0}
         self.validators: List[Callable] = []  # Plugin validators
         self.config_store: Dict[str, Any] = {}  # Global configuration
+        
+        # Catalog version - bumped whenever plugins are registered or unloaded
+        self._catalog_version = 0
     
     async def start(self):
         """Start the dynamic framework"""
@@ -139,11 +144,17 @@ class Framework:
         self.plugins[plugin.plugin_id] = plugin
         
         # Index capabilities
-        for capability_name in plugin.capabilities:
+        for capability_name, capability in plugin.capabilities.items():
             if capability_name not in self.global_capabilities:
                 self.global_capabilities[capability_name] = []
             self.global_capabilities[capability_name].append(plugin.plugin_id)
+            self.capability_providers.setdefault(capability_name, []).append({
+                "plugin_id": plugin.plugin_id,
+                "metadata": capability.metadata,
+                "parameters": [p.name for p in capability.signature.parameters.values()]
+            })
         
+        self._catalog_version += 1
         logger.info(f"Registered plugin: {plugin.plugin_id}")
     
     async def load_plugin(self, plugin: Plugin) -> bool:
@@ -196,8 +207,16 @@ class Framework:
                         self.global_capabilities[capability_name].remove(plugin_id)
                     if not self.global_capabilities[capability_name]:
                         del self.global_capabilities[capability_name]
+                if capability_name in self.capability_providers:
+                    remaining = [p for p in self.capability_providers[capability_name]
+                                 if p["plugin_id"] != plugin_id]
+                    if remaining:
+                        self.capability_providers[capability_name] = remaining
+                    else:
+                        del self.capability_providers[capability_name]
             
             del self.plugins[plugin_id]
+            self._catalog_version += 1
             
             await self.emit_event("plugin_unloaded", {"plugin_id": plugin_id})
             logger.info(f"Unloaded plugin: {plugin_id}")
@@ -304,9 +323,15 @@ class Framework:
         return self.extensions.get(extension_name)
     
     # Discovery and introspection
+    @property
+    def catalog_version(self) -> int:
+        """Counter that changes whenever plugins are registered or unloaded"""
+        return self._catalog_version
+    
     def list_capabilities(self) -> Dict[str, List[str]]:
         """List all available capabilities and which plugins provide them"""
-        return self.global_capabilities.copy()
+        # A fresh copy per call; the API caches the encoded response per catalog_version instead
+        return {name: list(plugin_ids) for name, plugin_ids in self.global_capabilities.items()}
     
     def get_plugin_info(self, plugin_id: str) -> Dict[str, Any]:
         """Get detailed plugin information"""
@@ -324,20 +349,9 @@ class Framework:
     
     def discover_capability_providers(self, capability_name: str) -> List[Dict[str, Any]]:
         """Find all plugins that can provide a capability"""
-        if capability_name not in self.global_capabilities:
-            return []
-        
-        providers = []
-        for plugin_id in self.global_capabilities[capability_name]:
-            plugin = self.plugins[plugin_id]
-            capability = plugin.capabilities[capability_name]
-            providers.append({
-                "plugin_id": plugin_id,
-                "metadata": capability.metadata,
-                "parameters": [p.name for p in capability.signature.parameters.values()]
-            })
-        
-        return providers
+        # Provider info is built once at registration time; hand out a copy so callers
+        # can sort or filter the result without touching the index
+        return list(self.capability_providers.get(capability_name, ()))
     
     def get_framework_stats(self) -> Dict[str, Any]:
         """Get comprehensive framework statistics"""
@@ -396,11 +410,12 @@ class Framework:
         plugin_usage = {pid: self.metrics.get(f"plugin_calls_{pid}", 0) for pid in available_plugins}
         return min(plugin_usage.items(), key=lambda x: x[1])[0]
     
-    def _generate_cache_key(self, capability: str, args: tuple, kwargs: dict, plugin_id: str = None) -> str:
+    def _generate_cache_key(self, capability: str, args: tuple, kwargs: dict, plugin_id: str = None) -> Tuple[str, Optional[str], bytes]:
         """Generate cache key for capability call"""
-        import hashlib
-        key_data = f"{capability}:{plugin_id}:{str(args)}:{str(sorted(kwargs.items()))}"
-        return hashlib.md5(key_data.encode()).hexdigest()
+        # Only the call arguments need digesting; capability and plugin_id stay as-is
+        # so names containing ':' can never collide
+        args_digest = hashlib.md5(repr((args, sorted(kwargs.items()))).encode()).digest()
+        return (capability, plugin_id, args_digest)
     
     def _should_cache(self, capability: str, result: Any) -> bool:
         """Determine if result should be cached"""
@@ -4,21 +4,59 @@ Loader - Loads plugins with zero configuration
 
 import os
 import sys
+import asyncio
 import importlib
 import importlib.util
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Type
+from typing import Dict, Any, List, Optional, Type, Tuple
 import logging
-import yaml
 import json
 import inspect
+import copy
 
 from .framework import Framework, Plugin
 from .plugin_base import BasePlugin, QuickPlugin
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 
+def _yaml_loads(content: bytes) -> Any:
+    """Parse YAML, importing PyYAML on first use"""
+    import yaml
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    return yaml.load(content, Loader=loader)
+
+
+# Manifest filenames in lookup priority order
+_MANIFEST_NAMES = ('plugin.yaml', 'plugin.yml', 'plugin.json')
+
+# Manifest parsers by file suffix
+_MANIFEST_PARSERS = {
+    '.yaml': _yaml_loads,
+    '.yml': _yaml_loads,
+    '.json': _json_loads,
+}
+
+# Conventional entry files checked before the <dir_name>.py fallback
+_ENTRY_FILES = ('plugin.py', 'main.py')
+
+# Module-level factory functions that may return a Plugin instance
+_FACTORY_FUNCTIONS = ('create_plugin', 'plugin', 'main', 'get_plugin')
+
+# Parsed manifests: path -> (st_mtime_ns, st_size, manifest)
+_MANIFEST_CACHE: Dict[str, Tuple[int, int, Any]] = {}
+
+# Executed plugin modules: module name -> (file path, st_mtime_ns, module)
+_MODULE_CACHE: Dict[str, Tuple[str, int, Any]] = {}
+
+
 class Loader:
     """Loads plugins with maximum flexibility and minimum configuration"""
     
@@ -37,26 +75,51 @@ class Loader:
             return results
         
         # Scan for any Python files or directories
-        for item in self.plugins_dir.rglob("*"):
-            if self._is_plugin_candidate(item):
-                try:
-                    plugin_id = self._generate_plugin_id(item)
-                    plugin = await self._load_plugin_from_path(item, plugin_id)
-                    
-                    if plugin:
-                        success = await self.framework.load_plugin(plugin)
-                        results[plugin_id] = success
-                        if success:
-                            logger.info(f"✅ Loaded plugin: {plugin_id}")
-                        else:
-                            logger.warning(f"⚠️ Failed to initialize: {plugin_id}")
-                    
-                except Exception as e:
-                    logger.error(f"❌ Error loading {item}: {e}")
-                    results[str(item)] = False
+        candidates = [item for item in self._iter_plugin_paths() if self._is_plugin_candidate(item)]
+        
+        # Warm the manifest cache concurrently: parsing is plain file I/O and runs no plugin code
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *(loop.run_in_executor(None, self._load_manifest, item) for item in candidates if item.is_dir()),
+            return_exceptions=True
+        )
+        
+        # Import and register one at a time, in discovery order, on the event loop thread, so
+        # plugin module code runs exactly as it would under a plain sequential import
+        for item in candidates:
+            try:
+                plugin_id, plugin = await self._load_candidate(item)
+                if plugin:
+                    success = await self.framework.load_plugin(plugin)
+                    results[plugin_id] = success
+                    if success:
+                        logger.info(f"✅ Loaded plugin: {plugin_id}")
+                    else:
+                        logger.warning(f"⚠️ Failed to initialize: {plugin_id}")
+                
+            except Exception as e:
+                logger.error(f"❌ Error loading {item}: {e}")
+                results[str(item)] = False
         
         return results
     
+    async def _load_candidate(self, path: Path) -> Tuple[str, Optional[Plugin]]:
+        """Build the plugin for a discovered candidate without registering it"""
+        plugin_id = self._generate_plugin_id(path)
+        return plugin_id, await self._load_plugin_from_path(path, plugin_id)
+    
+    def _iter_plugin_paths(self):
+        """Walk the plugins directory, pruning hidden and private directories"""
+        for root, dirs, files in os.walk(self.plugins_dir):
+            # Prune in place so os.walk never descends into .git, __pycache__, etc.
+            dirs[:] = [d for d in dirs if not d.startswith(('.', '_'))]
+            root_path = Path(root)
+            for name in dirs:
+                yield root_path / name
+            for name in files:
+                if not name.startswith(('.', '_')):
+                    yield root_path / name
+    
     def _is_plugin_candidate(self, path: Path) -> bool:
         """Check if path could be a plugin"""
         if path.is_file():
@@ -66,9 +129,11 @@ class Loader:
                    not path.name.startswith('_'))
         elif path.is_dir():
             # Directories with Python files or manifests
-            return (not path.name.startswith('.') and 
-                   not path.name.startswith('_') and
-                   (list(path.glob('*.py')) or list(path.glob('plugin.*'))))
+            if path.name.startswith(('.', '_')):
+                return False
+            with os.scandir(path) as entries:
+                return any(entry.name.endswith('.py') or entry.name.startswith('plugin.')
+                           for entry in entries)
         return False
     
     def _generate_plugin_id(self, path: Path) -> str:
@@ -116,7 +181,8 @@ class Loader:
         """Load plugin from directory with optional manifest"""
         try:
             # Check for manifest first
-            manifest = self._load_manifest(dir_path)
+            loop = asyncio.get_running_loop()
+            manifest = await loop.run_in_executor(None, self._load_manifest, dir_path)
             
             if manifest:
                 return await self._load_with_manifest(dir_path, plugin_id, manifest)
@@ -129,19 +195,33 @@ class Loader:
     
     def _load_manifest(self, dir_path: Path) -> Optional[Dict[str, Any]]:
         """Load plugin manifest if it exists"""
-        for manifest_file in ['plugin.yaml', 'plugin.yml', 'plugin.json']:
-            manifest_path = dir_path / manifest_file
-            if manifest_path.exists():
+        # One directory listing instead of an exists() probe per candidate name
+        present = set(os.listdir(dir_path))
+        for manifest_file in _MANIFEST_NAMES:
+            if manifest_file in present:
+                manifest_path = dir_path / manifest_file
                 try:
-                    with open(manifest_path, 'r') as f:
-                        if manifest_file.endswith('.json'):
-                            return json.load(f)
-                        else:
-                            return yaml.safe_load(f)
+                    return self._read_manifest(manifest_path)
                 except Exception as e:
                     logger.warning(f"Failed to load manifest {manifest_path}: {e}")
         return None
     
+    def _read_manifest(self, manifest_path: Path) -> Any:
+        """Parse a manifest file, reusing the cached result while it is unchanged"""
+        stat = manifest_path.stat()
+        cache_key = str(manifest_path)
+        cached = _MANIFEST_CACHE.get(cache_key)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            manifest = cached[2]
+        else:
+            parser = _MANIFEST_PARSERS.get(manifest_path.suffix, _yaml_loads)
+            with open(manifest_path, 'rb') as f:
+                manifest = parser(f.read())
+            _MANIFEST_CACHE[cache_key] = (stat.st_mtime_ns, stat.st_size, manifest)
+        
+        # Plugins receive manifest['config'] directly, so never hand out the cached object
+        return copy.deepcopy(manifest)
+    
     async def _load_with_manifest(self, dir_path: Path, plugin_id: str, manifest: Dict[str, Any]) -> Optional[Plugin]:
         """Load plugin using manifest configuration"""
         entrypoint = manifest.get('entrypoint', 'plugin.py')
@@ -175,7 +255,7 @@ class Loader:
     async def _load_without_manifest(self, dir_path: Path, plugin_id: str) -> Optional[Plugin]:
         """Load plugin without manifest - auto-discover"""
         # Look for common entry points
-        for entry_file in ['plugin.py', 'main.py', f'{dir_path.name}.py']:
+        for entry_file in (*_ENTRY_FILES, f'{dir_path.name}.py'):
             entry_path = dir_path / entry_file
             if entry_path.exists():
                 return await self._load_from_file(entry_path, plugin_id)
@@ -190,14 +270,11 @@ class Loader:
     async def _import_module(self, file_path: Path, module_name: str):
         """Import Python module from file"""
         try:
-            spec = importlib.util.spec_from_file_location(module_name, file_path)
-            if not spec or not spec.loader:
+            # Plugin top-level code may touch the event loop or signals, so it runs on this thread
+            module = self._exec_module(file_path, module_name)
+            if not module:
                 return None
             
-            module = importlib.util.module_from_spec(spec)
-            sys.modules[module_name] = module
-            spec.loader.exec_module(module)
-            
             self.loaded_modules[module_name] = module
             return module
             
@@ -205,6 +282,26 @@ class Loader:
             logger.error(f"Failed to import {file_path}: {e}")
             return None
     
+    def _exec_module(self, file_path: Path, module_name: str):
+        """Create and execute a module from file"""
+        # Reuse the module if this exact file was already executed and is unchanged.
+        # reload_plugin drops the sys.modules entry, which forces a fresh execution.
+        mtime = file_path.stat().st_mtime_ns
+        cached = _MODULE_CACHE.get(module_name)
+        if (cached and cached[0] == str(file_path) and cached[1] == mtime
+                and sys.modules.get(module_name) is cached[2]):
+            return cached[2]
+        
+        spec = importlib.util.spec_from_file_location(module_name, file_path)
+        if not spec or not spec.loader:
+            return None
+        
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+        _MODULE_CACHE[module_name] = (str(file_path), mtime, module)
+        return module
+    
     def _find_plugin_class(self, module, plugin_id: str) -> Optional[Plugin]:
         """Find plugin class in module"""
         # Look for classes that inherit from Plugin or BasePlugin
@@ -223,7 +320,7 @@ class Loader:
     def _find_plugin_function(self, module, plugin_id: str) -> Optional[Plugin]:
         """Find plugin factory function"""
         # Look for functions named create_plugin, plugin, etc.
-        for func_name in ['create_plugin', 'plugin', 'main', 'get_plugin']:
+        for func_name in _FACTORY_FUNCTIONS:
             func = getattr(module, func_name, None)
             if callable(func):
                 try:
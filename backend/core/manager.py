@@ -57,6 +57,10 @@ class Manager:
         """List all available capabilities"""
         return self.framework.list_capabilities()
     
+    def get_catalog_version(self) -> int:
+        """Get the plugin catalog version (changes on load/unload)"""
+        return self.framework.catalog_version
+    
     def get_plugin_info(self, plugin_id: str) -> Dict[str, Any]:
         """Get detailed plugin information"""
         return self.framework.get_plugin_info(plugin_id)
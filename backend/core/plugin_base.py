@@ -3,7 +3,30 @@ Plugin Base - Super easy plugin development
 """
 
 from .framework import Plugin
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
+
+# Public Plugin methods that are framework plumbing, never capabilities
+_NON_CAPABILITY_METHODS = frozenset({
+    'initialize', 'cleanup',
+    'provide', 'hook', 'execute_capability', 'trigger_hooks', 'get_capability_info'
+})
+
+# Stored on each class itself so reloaded plugin classes are freed with their module
+_METHOD_NAMES_ATTR = '_capability_method_names'
+
+
+def _capability_method_names(plugin_class: type) -> Tuple[str, ...]:
+    """Public callable attribute names of a plugin class, computed once per class"""
+    # Look in the class's own __dict__ so subclasses never reuse a parent's names
+    names = plugin_class.__dict__.get(_METHOD_NAMES_ATTR)
+    if names is None:
+        names = tuple(
+            name for name in dir(plugin_class)
+            if not name.startswith('_') and name not in _NON_CAPABILITY_METHODS
+            and callable(getattr(plugin_class, name, None))
+        )
+        setattr(plugin_class, _METHOD_NAMES_ATTR, names)
+    return names
 
 
 class BasePlugin(Plugin):
@@ -19,12 +42,10 @@ class BasePlugin(Plugin):
     
     def _auto_register_methods(self):
         """Automatically register methods as capabilities"""
-        for method_name in dir(self):
-            if not method_name.startswith('_') and method_name not in ['initialize', 'cleanup']:
-                method = getattr(self, method_name)
-                if callable(method) and not method_name in ['provide', 'hook', 'execute_capability', 'trigger_hooks', 'get_capability_info']:
-                    # Auto-register as capability
-                    self.capabilities[method_name] = self._create_capability(method_name, method)
+        for method_name in _capability_method_names(type(self)):
+            # Auto-register as capability
+            method = getattr(self, method_name)
+            self.capabilities[method_name] = self._create_capability(method_name, method)
     
     def _create_capability(self, name: str, method):
         """Create capability from method"""
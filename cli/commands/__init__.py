@@ -2,26 +2,25 @@
 CLI Commands Package
 """
 
-try:
-    from .init_command import InitCommand
-    from .validate_command import ValidateCommand
-    from .test_command import TestCommand
-    from .build_command import BuildCommand
-    from .dev_server_command import DevServerCommand
-    from .framework_command import FrameworkCommand
-except ImportError:
-    from init_command import InitCommand
-    from validate_command import ValidateCommand
-    from test_command import TestCommand
-    from build_command import BuildCommand
-    from dev_server_command import DevServerCommand
-    from framework_command import FrameworkCommand
+import importlib
 
-__all__ = [
-    "InitCommand",
-    "ValidateCommand", 
-    "TestCommand",
-    "BuildCommand",
-    "DevServerCommand",
-    "FrameworkCommand"
-]
\ No newline at end of file
+# Command class -> defining module; each module is imported on first access
+_COMMAND_MODULES = {
+    "InitCommand": ".init_command",
+    "ValidateCommand": ".validate_command",
+    "TestCommand": ".test_command",
+    "BuildCommand": ".build_command",
+    "DevServerCommand": ".dev_server_command",
+    "FrameworkCommand": ".framework_command",
+}
+
+__all__ = list(_COMMAND_MODULES)
+
+
+def __getattr__(name):
+    module_name = _COMMAND_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    command_class = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = command_class
+    return command_class
@@ -3,11 +3,62 @@ Base Command Class
 """
 
 import os
+import sys
 import json
 import yaml
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
+
+# Manifest filenames in lookup priority order
+_MANIFEST_NAMES = ("plugin.yaml", "plugin.yml", "plugin.json")
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# libyaml-backed loader/dumper when available
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def _yaml_load(stream) -> Any:
+    return yaml.load(stream, Loader=_YAML_LOADER)
+
+
+def _json_load(stream) -> Any:
+    return _json_loads(stream.read())
+
+
+# Manifest parsers by file suffix; each takes a binary file (both parsers detect the encoding)
+_MANIFEST_PARSERS = {
+    ".yaml": _yaml_load,
+    ".yml": _yaml_load,
+    ".json": _json_load,
+}
+
+
+def find_manifest_file(path: str = ".") -> Optional[Path]:
+    """Find plugin manifest file"""
+    plugin_dir = Path(path)
+    return next((p for n in _MANIFEST_NAMES if (p := plugin_dir / n).exists()), None)
+
+
+def find_and_load_manifest(path: str = ".") -> Optional[Dict[str, Any]]:
+    """Open and parse the first manifest present (None if there is none); raises on malformed files"""
+    plugin_dir = Path(path)
+    for name in _MANIFEST_NAMES:
+        manifest_file = plugin_dir / name
+        # Opening directly replaces a separate exists() probe per candidate
+        try:
+            f = open(manifest_file, 'rb')
+        except FileNotFoundError:
+            continue
+        with f:
+            return _MANIFEST_PARSERS.get(manifest_file.suffix, _json_load)(f)
+    return None
 
 
 class BaseCommand(ABC):
@@ -23,25 +74,12 @@ class BaseCommand(ABC):
     
     def find_manifest_file(self, path: str = ".") -> Optional[Path]:
         """Find plugin manifest file"""
-        plugin_dir = Path(path)
-        for filename in ['plugin.yaml', 'plugin.yml', 'plugin.json']:
-            manifest_path = plugin_dir / filename
-            if manifest_path.exists():
-                return manifest_path
-        return None
+        return find_manifest_file(path)
     
     def load_manifest(self, path: str = ".") -> Optional[Dict[str, Any]]:
         """Load plugin manifest"""
-        manifest_file = self.find_manifest_file(path)
-        if not manifest_file:
-            return None
-        
         try:
-            with open(manifest_file, 'r') as f:
-                if manifest_file.suffix in ['.yaml', '.yml']:
-                    return yaml.safe_load(f)
-                else:
-                    return json.load(f)
+            return find_and_load_manifest(path)
         except Exception as e:
             print(f"Error loading manifest: {e}")
             return None
@@ -53,7 +91,7 @@ class BaseCommand(ABC):
             if format == "yaml":
                 manifest_file = plugin_dir / "plugin.yaml"
                 with open(manifest_file, 'w') as f:
-                    yaml.dump(data, f, default_flow_style=False, indent=2)
+                    yaml.dump(data, f, Dumper=_YAML_DUMPER, default_flow_style=False, indent=2)
             else:
                 manifest_file = plugin_dir / "plugin.json"
                 with open(manifest_file, 'w') as f:
@@ -79,6 +117,10 @@ class BaseCommand(ABC):
         """Print info message"""
         print(f"ℹ️  {message}")
     
+    def write_lines(self, lines: List[str]):
+        """Write a block of output lines with a single stdout write"""
+        sys.stdout.write("\n".join(lines) + "\n")
+    
     def create_directory(self, path: Path) -> bool:
         """Create directory if it doesn't exist"""
         try:
@@ -91,8 +133,7 @@ class BaseCommand(ABC):
     def write_file(self, path: Path, content: str) -> bool:
         """Write content to file"""
         try:
-            with open(path, 'w') as f:
-                f.write(content)
+            path.write_bytes(content.encode('utf-8'))
             return True
         except Exception as e:
             self.print_error(f"Failed to write file {path}: {e}")
@@ -2,13 +2,50 @@
 Build Command - Build plugin package
 """
 
+import os
+import re
+import hashlib
+import stat
+import time
+import fnmatch
 import shutil
 import zipfile
 import tarfile
 from pathlib import Path
+from typing import Optional, Tuple
 from datetime import datetime
 from .base_command import BaseCommand
 
+# Read size for streaming files into archives
+_COPY_BUFFER_SIZE = 1 << 20
+
+# Already-compressed formats: stored in ZIPs as-is rather than deflated again
+_INCOMPRESSIBLE_SUFFIXES = frozenset({
+    '.png', '.jpg', '.jpeg', '.gif', '.webp', '.zip', '.gz', '.tgz', '.xz',
+    '.bz2', '.zst', '.whl', '.mp3', '.mp4'
+})
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+def _compile_globs(patterns: list):
+    """Combine fnmatch patterns into one compiled regex (None when empty)"""
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in patterns))
+
+
+def _split_glob(pattern: str) -> Tuple[str, str]:
+    """Split a glob at its first wildcard component, e.g. "src/**/*" -> ("src", "**/*")"""
+    parts = pattern.split("/")
+    for index, part in enumerate(parts):
+        if any(c in part for c in "*?["):
+            return "/".join(parts[:index]), "/".join(parts[index:])
+    return pattern, ""
+
 
 class BuildCommand(BaseCommand):
     """Build plugin package"""
@@ -21,27 +58,29 @@ class BuildCommand(BaseCommand):
         
         self.print_info(f"Building plugin package in format: {package_format}")
         
+        # Load manifest once; validation and packaging share it
+        manifest = self.load_manifest(str(plugin_path))
+        
         # Validate plugin
-        if not self._validate_plugin_for_build(plugin_path):
+        if not self._validate_plugin_for_build(plugin_path, manifest):
             return 1
         
         # Create output directory
         if not self.create_directory(output_dir):
             return 1
         
-        # Load manifest
-        manifest = self.load_manifest(str(plugin_path))
         if not manifest:
             self.print_error("Cannot load plugin manifest")
             return 1
         
         # Build package
         try:
-            package_path = self._create_package(plugin_path, output_dir, manifest, package_format)
+            use_cache = not getattr(args, 'no_cache', False)
+            package_path, files = self._create_package(plugin_path, output_dir, manifest, package_format, use_cache)
             
             if package_path:
                 self.print_success(f"Plugin package created: {package_path}")
-                self._print_package_info(package_path, manifest)
+                self._print_package_info(package_path, manifest, self._create_build_metadata(manifest, files))
                 return 0
             else:
                 self.print_error("Failed to create package")
@@ -51,10 +90,10 @@ class BuildCommand(BaseCommand):
             self.print_error(f"Build failed: {e}")
             return 1
     
-    def _validate_plugin_for_build(self, path: Path) -> bool:
+    def _validate_plugin_for_build(self, path: Path, manifest: dict) -> bool:
         """Validate plugin is ready for building"""
         # Check manifest exists
-        if not self.find_manifest_file(str(path)):
+        if manifest is None and not self.find_manifest_file(str(path)):
             self.print_error("No plugin manifest found")
             return False
         
@@ -64,7 +103,6 @@ class BuildCommand(BaseCommand):
             return False
         
         # Check entrypoint exists
-        manifest = self.load_manifest(str(path))
         if manifest and "entrypoint" in manifest:
             entrypoint_path = path / manifest["entrypoint"]
             if not entrypoint_path.exists():
@@ -73,16 +111,16 @@ class BuildCommand(BaseCommand):
         
         return True
     
-    def _create_package(self, plugin_path: Path, output_dir: Path, 
-                       manifest: dict, package_format: str) -> Path:
-        """Create the plugin package"""
+    def _create_package(self, plugin_path: Path, output_dir: Path, manifest: dict,
+                       package_format: str, use_cache: bool = True) -> Tuple[Optional[Path], list]:
+        """Create the plugin package; returns the package path and the packaged files"""
         plugin_name = manifest.get("key", "plugin")
         version = manifest.get("version", "1.0.0")
         
         # Package filename
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        if package_format == "zip":
-            package_name = f"{plugin_name}-{version}.zip"
+        if package_format in ("zip", "tar.zst"):
+            package_name = f"{plugin_name}-{version}.{package_format}"
         else:
             package_name = f"{plugin_name}-{version}.tar.gz"
         
@@ -118,85 +156,212 @@ class BuildCommand(BaseCommand):
         
         if not files_to_package:
             self.print_error("No files found to package")
-            return None
+            return None, files_to_package
+        
+        # Skip the rebuild when the previous package was made from identical inputs
+        fingerprint = self._fingerprint_files(files_to_package)
+        fingerprint_path = output_dir / f".{package_name}.fingerprint"
+        if use_cache and package_path.exists() and fingerprint_path.exists():
+            if fingerprint_path.read_text() == fingerprint:
+                self.print_info("Package inputs unchanged; reusing existing package (--no-cache to force)")
+                return package_path, files_to_package
+        
+        # Invalidate the old fingerprint first: an interrupted build must not leave a
+        # truncated archive that the next run would accept as up to date
+        fingerprint_path.unlink(missing_ok=True)
         
         # Create package
         if package_format == "zip":
-            return self._create_zip_package(package_path, plugin_path, files_to_package)
+            package_path = self._create_zip_package(package_path, files_to_package)
+        elif package_format == "tar.zst":
+            package_path = self._create_zstd_package(package_path, files_to_package)
         else:
-            return self._create_tar_package(package_path, plugin_path, files_to_package)
+            package_path = self._create_tar_package(package_path, files_to_package)
+        
+        if package_path:
+            fingerprint_path.write_text(fingerprint)
+        return package_path, files_to_package
+    
+    def _fingerprint_files(self, files: list) -> str:
+        """Hash archive names, sizes and mtimes of the collected files"""
+        digest = hashlib.sha256()
+        for _, arcname, st in files:
+            digest.update(f"{arcname}\0{st.st_size}\0{st.st_mtime_ns}\n".encode())
+        return digest.hexdigest()
     
     def _collect_files(self, plugin_path: Path, include_patterns: list, exclude_patterns: list) -> list:
-        """Collect files for packaging"""
-        import fnmatch
+        """Collect files for packaging as (path, arcname, stat) tuples"""
+        # Split excludes: "**/<dir>/**" prunes whole subtrees during the walk,
+        # "**/<name>" is checked against file names, anything else against the relative path.
+        # As with fnmatch on the relative path, "**/" needs a parent directory, so entries
+        # directly under the plugin root are never matched by the name-based checks.
+        excluded_dirs = set()
+        excluded_dir_globs = []
+        excluded_names = []
+        excluded_paths = []
+        for pattern in exclude_patterns:
+            name = pattern[3:-3] if pattern.endswith("/**") else pattern[3:]
+            if not pattern.startswith("**/") or "/" in name:
+                excluded_paths.append(pattern)
+            elif pattern.endswith("/**"):
+                if any(c in name for c in "*?["):
+                    excluded_dir_globs.append(name)
+                else:
+                    excluded_dirs.add(name)
+            else:
+                excluded_names.append(name)
+        
+        # Each glob group is translated and compiled once for the whole walk
+        dir_glob_re = _compile_globs(excluded_dir_globs)
+        name_re = _compile_globs(excluded_names)
+        path_re = _compile_globs(excluded_paths)
+        
+        def is_excluded_dir(name: str, relative_path: str) -> bool:
+            if "/" not in relative_path:
+                return False
+            return name in excluded_dirs or (dir_glob_re is not None and dir_glob_re.match(name) is not None)
+        
+        def is_excluded_file(name: str, relative_path: str) -> bool:
+            return (("/" in relative_path and name_re is not None and name_re.match(name) is not None) or
+                    (path_re is not None and path_re.match(relative_path) is not None))
         
         files_to_package = []
+        root_str = os.fspath(plugin_path)
         
         for pattern in include_patterns:
-            matching_files = list(plugin_path.glob(pattern))
-            for file_path in matching_files:
-                if file_path.is_file():
-                    # Check if file should be excluded
-                    relative_path = file_path.relative_to(plugin_path)
-                    should_exclude = False
-                    
-                    for exclude_pattern in exclude_patterns:
-                        if fnmatch.fnmatch(str(relative_path), exclude_pattern):
-                            should_exclude = True
-                            break
-                    
-                    if not should_exclude:
-                        files_to_package.append(file_path)
-        
-        return files_to_package
+            relative_root, tail = _split_glob(pattern)
+            if tail == "**/*":
+                # Recursive include: one scandir walk from the pattern's root directory,
+                # carrying POSIX relative paths (archive names) along instead of recomputing them
+                start = os.path.join(root_str, relative_root) if relative_root else root_str
+                if not os.path.isdir(start):
+                    continue
+                stack = [(start, relative_root + "/" if relative_root else "")]
+                # (st_dev, st_ino) of visited directories, so bind-mount loops are walked once
+                seen = set()
+                while stack:
+                    directory, prefix = stack.pop()
+                    with os.scandir(directory) as entries:
+                        for entry in entries:
+                            relative_path = prefix + entry.name
+                            if entry.is_dir(follow_symlinks=False):
+                                if not is_excluded_dir(entry.name, relative_path):
+                                    st = entry.stat(follow_symlinks=False)
+                                    key = (st.st_dev, st.st_ino)
+                                    if key not in seen:
+                                        seen.add(key)
+                                        stack.append((entry.path, relative_path + "/"))
+                            elif entry.is_file() and not is_excluded_file(entry.name, relative_path):
+                                files_to_package.append((entry.path, relative_path, entry.stat()))
+            elif not tail:
+                # Literal file name: a single stat, no globbing
+                file_path = os.path.join(root_str, pattern)
+                try:
+                    st = os.stat(file_path)
+                except OSError:
+                    continue
+                if stat.S_ISREG(st.st_mode) and not is_excluded_file(os.path.basename(pattern), pattern):
+                    files_to_package.append((file_path, pattern, st))
+            else:
+                # Other globs only search below their literal prefix
+                base = plugin_path / relative_root
+                if not base.is_dir():
+                    continue
+                for file_path in base.glob(tail):
+                    relative_path = file_path.relative_to(plugin_path).as_posix()
+                    if file_path.is_file() and not is_excluded_file(file_path.name, relative_path):
+                        files_to_package.append((os.fspath(file_path), relative_path, file_path.stat()))
+        
+        # Overlapping includes must not add an entry twice; sort for reproducible archives
+        unique_files = {}
+        for item in files_to_package:
+            unique_files.setdefault(item[1], item)
+        return sorted(unique_files.values(), key=lambda item: item[1])
+    
+    def _zip_info(self, arcname: str, st: os.stat_result) -> zipfile.ZipInfo:
+        """Build a ZipInfo from an already collected stat (what ZipInfo.from_file does, minus the stat)"""
+        date_time = time.localtime(st.st_mtime)[:6]
+        if date_time[0] < 1980:
+            date_time = (1980, 1, 1, 0, 0, 0)
+        zinfo = zipfile.ZipInfo(arcname, date_time)
+        zinfo.external_attr = (st.st_mode & 0xFFFF) << 16
+        zinfo.file_size = st.st_size
+        suffix = os.path.splitext(arcname)[1].lower()
+        zinfo.compress_type = zipfile.ZIP_STORED if suffix in _INCOMPRESSIBLE_SUFFIXES else zipfile.ZIP_DEFLATED
+        return zinfo
     
-    def _create_zip_package(self, package_path: Path, plugin_path: Path, files: list) -> Path:
+    def _add_tar_files(self, tarf: tarfile.TarFile, files: list):
+        """Add collected files using their recorded stat instead of a second stat per file"""
+        for file_path, arcname, st in files:
+            tarinfo = tarfile.TarInfo(arcname)
+            tarinfo.size = st.st_size
+            tarinfo.mtime = int(st.st_mtime)
+            tarinfo.mode = stat.S_IMODE(st.st_mode)
+            with open(file_path, 'rb', buffering=_COPY_BUFFER_SIZE) as src:
+                tarf.addfile(tarinfo, src)
+    
+    def _create_zip_package(self, package_path: Path, files: list) -> Path:
         """Create ZIP package"""
         with zipfile.ZipFile(package_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for file_path in files:
-                arcname = file_path.relative_to(plugin_path)
-                zipf.write(file_path, arcname)
+            for file_path, arcname, st in files:
+                # Stream in 1 MB blocks; the known size lets zipfile pick ZIP64 when needed
+                zinfo = self._zip_info(arcname, st)
+                with open(file_path, 'rb') as src, zipf.open(zinfo, 'w') as dst:
+                    shutil.copyfileobj(src, dst, _COPY_BUFFER_SIZE)
                 
         return package_path
     
-    def _create_tar_package(self, package_path: Path, plugin_path: Path, files: list) -> Path:
+    def _create_tar_package(self, package_path: Path, files: list) -> Path:
         """Create TAR.GZ package"""
-        with tarfile.open(package_path, 'w:gz') as tarf:
-            for file_path in files:
-                arcname = file_path.relative_to(plugin_path)
-                tarf.add(file_path, arcname)
+        # Level 6 is markedly faster than the default 9 for a near-identical size
+        with tarfile.open(package_path, 'w:gz', compresslevel=6) as tarf:
+            self._add_tar_files(tarf, files)
                 
         return package_path
     
-    def _print_package_info(self, package_path: Path, manifest: dict):
-        """Print information about the created package"""
-        import os
+    def _create_zstd_package(self, package_path: Path, files: list) -> Optional[Path]:
+        """Create TAR.ZST package (requires the optional zstandard package)"""
+        if zstandard is None:
+            self.print_error("tar.zst packages require zstandard: pip install zstandard")
+            return None
+        
+        # threads=-1 lets libzstd compress on all cores
+        compressor = zstandard.ZstdCompressor(level=3, threads=-1)
+        with open(package_path, 'wb') as raw, compressor.stream_writer(raw) as zst:
+            with tarfile.open(fileobj=zst, mode='w|') as tarf:
+                self._add_tar_files(tarf, files)
         
+        return package_path
+    
+    def _print_package_info(self, package_path: Path, manifest: dict, metadata: dict):
+        """Print information about the created package"""
         size_mb = os.path.getsize(package_path) / (1024 * 1024)
         
-        print(f"")
-        print(f"📦 Package Details:")
-        print(f"   Name: {manifest.get('name', 'Unknown')}")
-        print(f"   Version: {manifest.get('version', 'Unknown')}")
-        print(f"   Type: {manifest.get('type', 'Unknown')}")
-        print(f"   Size: {size_mb:.2f} MB")
-        print(f"   Location: {package_path}")
-        print(f"")
-        print(f"🚀 Ready for distribution!")
-        
-        # Print next steps
-        print(f"Next steps:")
-        print(f"  1. Test the package: rag-plugin test")
-        print(f"  2. Validate: rag-plugin validate --strict")
-        print(f"  3. Publish to registry (when available)")
+        self.write_lines([
+            "",
+            "📦 Package Details:",
+            f"   Name: {manifest.get('name', 'Unknown')}",
+            f"   Version: {manifest.get('version', 'Unknown')}",
+            f"   Type: {manifest.get('type', 'Unknown')}",
+            f"   Files: {metadata['files_included']}",
+            f"   Size: {size_mb:.2f} MB",
+            f"   Location: {package_path}",
+            "",
+            "🚀 Ready for distribution!",
+            # Next steps
+            "Next steps:",
+            "  1. Test the package: rag-plugin test",
+            "  2. Validate: rag-plugin validate --strict",
+            "  3. Publish to registry (when available)",
+        ])
     
-    def _create_build_metadata(self, plugin_path: Path, manifest: dict) -> dict:
-        """Create build metadata"""
+    def _create_build_metadata(self, manifest: dict, files: list) -> dict:
+        """Create build metadata for the files already collected by _create_package"""
         return {
             "build_time": datetime.now().isoformat(),
             "plugin_name": manifest.get("name"),
             "plugin_version": manifest.get("version"),
             "plugin_type": manifest.get("type"),
             "builder_version": "1.0.0",
-            "files_included": len(self._collect_files(plugin_path, ["**/*"], [])),
+            "files_included": len(files),
         }
\ No newline at end of file
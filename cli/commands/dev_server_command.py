@@ -2,13 +2,18 @@
 Dev Server Command - Start development server for testing
 """
 
-import asyncio
-import threading
-import time
+import json
 from pathlib import Path
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
 from .base_command import BaseCommand
 
 
+def _json_response(body: bytes) -> bytes:
+    """Complete HTTP/1.0 200 response (status line, headers and body) for a JSON payload"""
+    return (b"HTTP/1.0 200 OK\r\nContent-Type: application/json\r\n"
+            b"Content-Length: %d\r\n\r\n%s" % (len(body), body))
+
+
 class DevServerCommand(BaseCommand):
     """Start development server for testing plugins"""
     
@@ -49,29 +54,27 @@ class DevServerCommand(BaseCommand):
     
     def _start_dev_server(self, host: str, port: int):
         """Start the development server"""
-        from http.server import HTTPServer, SimpleHTTPRequestHandler
-        import json
-        
         manifest = self.load_manifest()
         
+        # Both API responses are fixed for the server's lifetime, so build the raw bytes once
+        status = {"status": "running", "plugin": (manifest or {}).get("name", "Unknown")}
+        api_responses = {
+            "/api/plugin/info": _json_response(json.dumps(manifest).encode()),
+            "/api/plugin/status": _json_response(json.dumps(status).encode()),
+        }
+        
         class PluginDevHandler(SimpleHTTPRequestHandler):
             def do_GET(self):
-                if self.path == "/api/plugin/info":
-                    self.send_response(200)
-                    self.send_header('Content-type', 'application/json')
-                    self.end_headers()
-                    self.wfile.write(json.dumps(manifest).encode())
-                elif self.path == "/api/plugin/status":
-                    self.send_response(200)
-                    self.send_header('Content-type', 'application/json')
-                    self.end_headers()
-                    status = {"status": "running", "plugin": manifest.get("name", "Unknown")}
-                    self.wfile.write(json.dumps(status).encode())
+                response = api_responses.get(self.path)
+                if response is not None:
+                    self.log_request(200)
+                    self.wfile.write(response)
                 else:
                     # Serve static files or development UI
                     super().do_GET()
         
-        server = HTTPServer((host, port), PluginDevHandler)
+        # Threaded so a slow static download does not block the API endpoints
+        server = ThreadingHTTPServer((host, port), PluginDevHandler)
         
         self.print_success(f"Development server running at http://{host}:{port}")
         self.print_info("Available endpoints:")
@@ -3,7 +3,10 @@ Init Command - Initialize new plugin project
 """
 
 import os
+import re
+import copy
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, Any
 from .base_command import BaseCommand
 try:
@@ -14,6 +17,76 @@ except ImportError:
     sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
     from templates import PluginTemplates
 
+# Plugin names: lowercase letters, digits and hyphens (\Z rejects a trailing newline)
+_NAME_RE = re.compile(r'^[a-z0-9-]+\Z')
+
+# Subdirectories of a new plugin project
+_PROJECT_DIRECTORIES = ("src", "tests", "docs", "examples")
+
+# Word separators for PascalCase conversion
+_WORD_SEPARATOR_RE = re.compile(r'[-_]')
+
+# Default capabilities per plugin type
+_DEFAULT_CAPABILITIES = MappingProxyType({
+    "datasource": ("read_data", "query_data"),
+    "vectordb": ("store_vectors", "query_vectors", "delete_vectors"),
+    "llm": ("generate_text", "generate_embeddings"),
+    "utility": ("process_data",)
+})
+
+# Default config schema per plugin type (read-only); entries are copied before being handed out
+_DEFAULT_SCHEMAS = MappingProxyType({
+    "datasource": {
+        "connection_string": {
+            "type": "string",
+            "required": True,
+            "description": "Database connection string"
+        },
+        "table_name": {
+            "type": "string", 
+            "required": True,
+            "description": "Table name to query"
+        }
+    },
+    "vectordb": {
+        "collection_name": {
+            "type": "string",
+            "required": True,
+            "description": "Collection name"
+        },
+        "dimension": {
+            "type": "integer",
+            "required": True,
+            "description": "Vector dimension"
+        }
+    },
+    "llm": {
+        "api_key": {
+            "type": "string",
+            "required": True,
+            "description": "API key"
+        },
+        "model": {
+            "type": "string",
+            "required": True,
+            "description": "Model name"
+        },
+        "temperature": {
+            "type": "number",
+            "minimum": 0,
+            "maximum": 2,
+            "description": "Sampling temperature"
+        }
+    },
+    "utility": {
+        "enabled": {
+            "type": "boolean",
+            "required": True,
+            "description": "Enable utility"
+        }
+    }
+})
+
 
 class InitCommand(BaseCommand):
     """Initialize a new plugin project"""
@@ -62,8 +135,7 @@ class InitCommand(BaseCommand):
     
     def _is_valid_plugin_name(self, name: str) -> bool:
         """Validate plugin name"""
-        import re
-        return bool(re.match(r'^[a-z0-9-]+$', name))
+        return _NAME_RE.match(name) is not None
     
     def _create_plugin_structure(self, plugin_dir: Path, name: str, plugin_type: str, 
                                template_type: str, author: str, description: str):
@@ -73,41 +145,23 @@ class InitCommand(BaseCommand):
         manifest = self._create_manifest(name, plugin_type, author, description)
         self.save_manifest(manifest, str(plugin_dir))
         
-        # Create directory structure
-        directories = [
-            plugin_dir / "src",
-            plugin_dir / "tests", 
-            plugin_dir / "docs",
-            plugin_dir / "examples"
-        ]
-        
-        for directory in directories:
-            self.create_directory(directory)
-        
-        # Create main plugin file
+        # Render every file up front so a template error leaves no half-written tree
         templates = PluginTemplates()
-        main_content = templates.get_main_template(plugin_type, name, template_type)
-        self.write_file(plugin_dir / "src" / f"{name}_plugin.py", main_content)
-        
-        # Create init file
-        init_content = templates.get_init_template(name)
-        self.write_file(plugin_dir / "src" / "__init__.py", init_content)
-        
-        # Create test file
-        test_content = templates.get_test_template(plugin_type, name)
-        self.write_file(plugin_dir / "tests" / f"test_{name}.py", test_content)
-        
-        # Create requirements file
-        requirements = templates.get_requirements_template(plugin_type)
-        self.write_file(plugin_dir / "requirements.txt", requirements)
+        files = [
+            (plugin_dir / "src" / f"{name}_plugin.py", templates.get_main_template(plugin_type, name, template_type)),
+            (plugin_dir / "src" / "__init__.py", templates.get_init_template(name)),
+            (plugin_dir / "tests" / f"test_{name}.py", templates.get_test_template(plugin_type, name)),
+            (plugin_dir / "requirements.txt", templates.get_requirements_template(plugin_type)),
+            (plugin_dir / "README.md", templates.get_readme_template(name, plugin_type, description)),
+            (plugin_dir / "setup.py", templates.get_setup_template(name, plugin_type, author, description)),
+        ]
         
-        # Create README
-        readme_content = templates.get_readme_template(name, plugin_type, description)
-        self.write_file(plugin_dir / "README.md", readme_content)
+        # Create directory structure, then write all files in one pass
+        for directory in _PROJECT_DIRECTORIES:
+            self.create_directory(plugin_dir / directory)
         
-        # Create setup.py
-        setup_content = templates.get_setup_template(name, plugin_type, author, description)
-        self.write_file(plugin_dir / "setup.py", setup_content)
+        for path, content in files:
+            self.write_file(path, content)
     
     def _create_manifest(self, name: str, plugin_type: str, author: str, description: str) -> Dict[str, Any]:
         """Create plugin manifest"""
@@ -133,69 +187,12 @@ class InitCommand(BaseCommand):
     
     def _to_pascal_case(self, snake_str: str) -> str:
         """Convert snake_case or kebab-case to PascalCase"""
-        return ''.join(word.capitalize() for word in snake_str.replace('-', '_').split('_'))
+        return ''.join(word.capitalize() for word in _WORD_SEPARATOR_RE.split(snake_str))
     
     def _get_default_schema(self, plugin_type: str) -> Dict[str, Any]:
         """Get default configuration schema for plugin type"""
-        schemas = {
-            "datasource": {
-                "connection_string": {
-                    "type": "string",
-                    "required": True,
-                    "description": "Database connection string"
-                },
-                "table_name": {
-                    "type": "string", 
-                    "required": True,
-                    "description": "Table name to query"
-                }
-            },
-            "vectordb": {
-                "collection_name": {
-                    "type": "string",
-                    "required": True,
-                    "description": "Collection name"
-                },
-                "dimension": {
-                    "type": "integer",
-                    "required": True,
-                    "description": "Vector dimension"
-                }
-            },
-            "llm": {
-                "api_key": {
-                    "type": "string",
-                    "required": True,
-                    "description": "API key"
-                },
-                "model": {
-                    "type": "string",
-                    "required": True,
-                    "description": "Model name"
-                },
-                "temperature": {
-                    "type": "number",
-                    "minimum": 0,
-                    "maximum": 2,
-                    "description": "Sampling temperature"
-                }
-            },
-            "utility": {
-                "enabled": {
-                    "type": "boolean",
-                    "required": True,
-                    "description": "Enable utility"
-                }
-            }
-        }
-        return schemas.get(plugin_type, {})
+        return copy.deepcopy(_DEFAULT_SCHEMAS.get(plugin_type, {}))
     
     def _get_default_capabilities(self, plugin_type: str) -> list:
         """Get default capabilities for plugin type"""
-        capabilities = {
-            "datasource": ["read_data", "query_data"],
-            "vectordb": ["store_vectors", "query_vectors", "delete_vectors"],
-            "llm": ["generate_text", "generate_embeddings"],
-            "utility": ["process_data"]
-        }
-        return capabilities.get(plugin_type, [])
\ No newline at end of file
+        return list(_DEFAULT_CAPABILITIES.get(plugin_type, ()))
\ No newline at end of file
@@ -2,71 +2,22 @@
 Test Command - Run plugin tests
 """
 
+import hashlib
+import importlib.util
+import os
 import subprocess
 import sys
+from collections import deque
 from pathlib import Path
 from .base_command import BaseCommand
 
+# Records the interpreter and requirements.txt hash of the last successful dependency install
+_DEPS_STAMP = ".rag-plugin-deps-installed"
 
-class TestCommand(BaseCommand):
-    """Run plugin tests"""
-    
-    def execute(self, args) -> int:
-        """Execute test command"""
-        plugin_path = Path(args.path)
-        local_mode = args.local
-        coverage = args.coverage
-        
-        self.print_info(f"Running tests for plugin at: {plugin_path}")
-        
-        # Check if plugin exists
-        if not self._is_valid_plugin_directory(plugin_path):
-            self.print_error("Not a valid plugin directory")
-            return 1
-        
-        # Check for test files
-        test_files = self._find_test_files(plugin_path)
-        if not test_files:
-            self.print_warning("No test files found")
-            if not local_mode:
-                self.print_info("Creating basic test structure...")
-                self._create_basic_tests(plugin_path)
-                test_files = self._find_test_files(plugin_path)
-        
-        if local_mode:
-            return self._run_local_tests(plugin_path, test_files, coverage)
-        else:
-            return self._run_integration_tests(plugin_path, test_files, coverage)
-    
-    def _is_valid_plugin_directory(self, path: Path) -> bool:
-        """Check if directory contains a valid plugin"""
-        manifest_file = self.find_manifest_file(str(path))
-        src_dir = path / "src"
-        return manifest_file is not None and src_dir.exists()
-    
-    def _find_test_files(self, path: Path) -> list:
-        """Find test files in the plugin directory"""
-        test_dirs = [path / "tests", path / "test"]
-        test_files = []
-        
-        for test_dir in test_dirs:
-            if test_dir.exists():
-                test_files.extend(list(test_dir.glob("test_*.py")))
-                test_files.extend(list(test_dir.glob("*_test.py")))
-        
-        return test_files
-    
-    def _create_basic_tests(self, path: Path):
-        """Create basic test structure if none exists"""
-        test_dir = path / "tests"
-        test_dir.mkdir(exist_ok=True)
-        
-        manifest = self.load_manifest(str(path))
-        if not manifest:
-            return
-        
-        plugin_name = manifest.get("key", "plugin")
-        test_content = f'''"""
+# Lines of pip output kept for the failure report
+_PIP_OUTPUT_TAIL_LINES = 200
+
+_BASIC_TEST_TEMPLATE = '''"""
 Basic tests for {plugin_name}
 """
 
@@ -83,7 +34,7 @@ def test_plugin_import():
     """Test that plugin can be imported"""
     try:
         # Try to import the main plugin module
-        import {plugin_name.replace("-", "_")}_plugin
+        import {module_name}_plugin
         assert True
     except ImportError as e:
         pytest.fail(f"Failed to import plugin: {{e}}")
@@ -92,7 +43,7 @@ def test_plugin_import():
 def test_plugin_creation():
     """Test that plugin can be created with basic config"""
     try:
-        from {plugin_name.replace("-", "_")}_plugin import create_plugin
+        from {module_name}_plugin import create_plugin
         
         config = {{}}  # Add basic test config here
         plugin = create_plugin(config)
@@ -105,7 +56,7 @@ def test_plugin_creation():
 async def test_plugin_initialization():
     """Test plugin initialization"""
     try:
-        from {plugin_name.replace("-", "_")}_plugin import create_plugin
+        from {module_name}_plugin import create_plugin
         
         config = {{}}  # Add basic test config here
         plugin = create_plugin(config)
@@ -119,13 +70,83 @@ async def test_plugin_initialization():
     except Exception as e:
         pytest.fail(f"Plugin initialization failed: {{e}}")
 '''
+
+
+class TestCommand(BaseCommand):
+    """Run plugin tests"""
+    
+    def execute(self, args) -> int:
+        """Execute test command"""
+        plugin_path = Path(args.path)
+        local_mode = args.local
+        coverage = args.coverage
+        
+        self.print_info(f"Running tests for plugin at: {plugin_path}")
+        
+        # Check if plugin exists
+        if not self._is_valid_plugin_directory(plugin_path):
+            self.print_error("Not a valid plugin directory")
+            return 1
+        
+        # Check for test files
+        test_files = self._find_test_files(plugin_path)
+        if not test_files:
+            self.print_warning("No test files found")
+            if not local_mode:
+                self.print_info("Creating basic test structure...")
+                test_files = self._create_basic_tests(plugin_path)
+        
+        if local_mode:
+            return self._run_local_tests(plugin_path, test_files, coverage)
+        else:
+            return self._run_integration_tests(plugin_path, test_files, coverage)
+    
+    def _is_valid_plugin_directory(self, path: Path) -> bool:
+        """Check if directory contains a valid plugin"""
+        # One stat for src/ before probing up to three manifest names
+        if not (path / "src").is_dir():
+            return False
+        return self.find_manifest_file(str(path)) is not None
+    
+    def _find_test_files(self, path: Path) -> list:
+        """Find test files in the plugin directory"""
+        test_dirs = [path / "tests", path / "test"]
+        test_files = []
+        
+        for test_dir in test_dirs:
+            # One directory pass matching both "test_*.py" and "*_test.py"
+            try:
+                with os.scandir(test_dir) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        if name.endswith(".py") and (name.startswith("test_") or name.endswith("_test.py")):
+                            test_files.append(Path(entry.path))
+            except (FileNotFoundError, NotADirectoryError):
+                continue
         
-        test_file = test_dir / f"test_{plugin_name.replace('-', '_')}.py"
+        return test_files
+    
+    def _create_basic_tests(self, path: Path) -> list:
+        """Create basic test structure if none exists, returning the test files written"""
+        test_dir = path / "tests"
+        test_dir.mkdir(exist_ok=True)
+        
+        manifest = self.load_manifest(str(path))
+        if not manifest:
+            return []
+        
+        plugin_name = manifest.get("key", "plugin")
+        module_name = plugin_name.replace("-", "_")
+        test_content = _BASIC_TEST_TEMPLATE.format(plugin_name=plugin_name, module_name=module_name)
+        
+        test_file = test_dir / f"test_{module_name}.py"
         self.write_file(test_file, test_content)
         
         # Create __init__.py
         init_file = test_dir / "__init__.py"
         self.write_file(init_file, "# Test package")
+        
+        return [test_file]
     
     def _run_local_tests(self, path: Path, test_files: list, coverage: bool) -> int:
         """Run tests in local environment"""
@@ -135,18 +156,10 @@ async def test_plugin_initialization():
         original_cwd = Path.cwd()
         try:
             # Install dependencies
-            if (path / "requirements.txt").exists():
-                self.print_info("Installing dependencies...")
-                result = subprocess.run([
-                    sys.executable, "-m", "pip", "install", "-r", "requirements.txt"
-                ], cwd=path, capture_output=True, text=True)
-                
-                if result.returncode != 0:
-                    self.print_warning("Failed to install some dependencies")
-                    print(result.stderr)
+            self._install_plugin_requirements(path)
             
-            # Run pytest
-            cmd = [sys.executable, "-m", "pytest", "-v"]
+            # Run pytest; the CLI never passes --lf/--ff, so the cache plugin is pure startup cost
+            cmd = [sys.executable, "-m", "pytest", "-v", "-p", "no:cacheprovider"]
             
             if coverage:
                 cmd.extend(["--cov=src", "--cov-report=term-missing"])
@@ -170,6 +183,35 @@ async def test_plugin_initialization():
             self.print_error(f"Error running tests: {e}")
             return 1
     
+    def _install_plugin_requirements(self, path: Path):
+        """Install requirements.txt unless this interpreter already installed the same contents"""
+        try:
+            requirements = (path / "requirements.txt").read_bytes()
+        except FileNotFoundError:
+            return
+        
+        stamp_file = path / _DEPS_STAMP
+        stamp = f"{sys.executable}\n{hashlib.sha256(requirements).hexdigest()}\n"
+        try:
+            if stamp_file.read_text(encoding="utf-8") == stamp:
+                return
+        except (OSError, UnicodeDecodeError):
+            pass
+        
+        self.print_info("Installing dependencies...")
+        # Stream pip's output and keep only the tail, rather than buffering all of it
+        with subprocess.Popen([
+            sys.executable, "-m", "pip", "install", "--disable-pip-version-check", "--no-input",
+            "-r", "requirements.txt"
+        ], cwd=path, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True) as proc:
+            tail = deque(proc.stdout, maxlen=_PIP_OUTPUT_TAIL_LINES)
+        
+        if proc.returncode != 0:
+            self.print_warning("Failed to install some dependencies")
+            sys.stdout.write("".join(tail))
+        else:
+            stamp_file.write_text(stamp, encoding="utf-8")
+    
     def _run_integration_tests(self, path: Path, test_files: list, coverage: bool) -> int:
         """Run tests with RAG Builder integration"""
         self.print_info("Running integration tests with RAG Builder...")
@@ -188,12 +230,7 @@ async def test_plugin_initialization():
     
     def _check_pytest_available(self) -> bool:
         """Check if pytest is available"""
-        try:
-            subprocess.run([sys.executable, "-m", "pytest", "--version"], 
-                         capture_output=True, check=True)
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return False
+        return importlib.util.find_spec("pytest") is not None
     
     def _install_test_dependencies(self) -> bool:
         """Install testing dependencies"""
@@ -2,12 +2,118 @@
 Validate Command - Validate plugin configuration and code
 """
 
+import os
+import re
 import ast
-import importlib.util
+import sys
+import json
+import hashlib
+import tempfile
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Set, Tuple
 from .base_command import BaseCommand
 
+# Manifest rules, built once rather than on every validation
+_REQUIRED_MANIFEST_FIELDS = ("name", "type", "version", "entrypoint", "main_class")
+_RECOMMENDED_MANIFEST_FIELDS = ("description", "author", "license", "config_schema")
+_VALID_PLUGIN_TYPES = ("datasource", "vectordb", "llm", "utility")
+_VALID_PLUGIN_TYPE_SET = frozenset(_VALID_PLUGIN_TYPES)
+_REQUIRED_CLASS_METHODS = ("validate_config", "initialize")
+_SEMVER_RE = re.compile(r'^\d+\.\d+\.\d+(?:-[a-zA-Z0-9]+)?$')
+
+# Syntax-check files in a process pool above this many files
+_PARALLEL_PARSE_THRESHOLD = 32
+
+# Files that passed the syntax check, keyed by (mtime_ns, size, inode), one JSON file per plugin tree
+_SYNTAX_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "rag-plugin" / "syntax"
+
+
+def _check_python_file(py_file: Path) -> List[str]:
+    """Syntax-check one Python file; module level so worker processes can run it"""
+    errors = []
+    try:
+        # Bytes go straight to the tokenizer, which honours PEP 263 coding cookies
+        with open(py_file, 'rb') as f:
+            content = f.read()
+        
+        # Parse the Python code (AST only, ignoring this module's __future__ flags)
+        compile(content, str(py_file), 'exec', ast.PyCF_ONLY_AST, dont_inherit=True)
+        
+        # Additional checks; the cheap name test runs before the content scan
+        if py_file.name.endswith("_plugin.py") and b"class " not in content:
+            errors.append(f"No class definition found in main plugin file: {py_file}")
+        
+    except SyntaxError as e:
+        errors.append(f"Syntax error in {py_file}: {e}")
+    except Exception as e:
+        errors.append(f"Error reading {py_file}: {e}")
+    
+    return errors
+
+
+def _scan_plugin(root: str) -> Tuple[Set[str], List[Tuple[Path, Optional[os.stat_result]]]]:
+    """Walk the plugin once, returning the names at its top level and every .py file below it
+    with its stat; like rglob, symlinked directories are not descended"""
+    root_names = set()
+    python_files = []
+    stack = [root]
+    # (st_dev, st_ino) of visited directories, so bind-mount loops are walked once
+    seen = set()
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if directory is root:
+                        root_names.add(entry.name)
+                    if entry.is_dir(follow_symlinks=False):
+                        st = entry.stat(follow_symlinks=False)
+                        key = (st.st_dev, st.st_ino)
+                        if key not in seen:
+                            seen.add(key)
+                            stack.append(entry.path)
+                    elif entry.name.endswith(".py") and entry.is_file():
+                        try:
+                            st = entry.stat()
+                        except OSError:
+                            st = None
+                        python_files.append((Path(entry.path), st))
+        except OSError:
+            continue
+    return root_names, python_files
+
+
+def _syntax_cache_path(root: str) -> Path:
+    """Cache file for a plugin tree; the interpreter version is part of the key since grammar changes"""
+    key = f"{os.path.abspath(root)}|{sys.version_info[0]}.{sys.version_info[1]}"
+    return _SYNTAX_CACHE_DIR / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.json"
+
+
+def _load_syntax_cache(cache_path: Path) -> Dict[str, list]:
+    """Load cached file signatures, treating a missing or corrupt cache as empty"""
+    try:
+        with open(cache_path, 'rb') as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_syntax_cache(cache_path: Path, cache: Dict[str, list]):
+    """Write the cache atomically; failing to cache never fails validation"""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(cache, f)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        pass
+
 
 class ValidateCommand(BaseCommand):
     """Validate plugin configuration and code"""
@@ -22,18 +128,24 @@ class ValidateCommand(BaseCommand):
         errors = []
         warnings = []
         
+        # Parse the manifest once; every phase that needs it shares this copy
+        manifest = self.load_manifest(plugin_path)
+        
         # Validate manifest
-        manifest_errors, manifest_warnings = self._validate_manifest(plugin_path, strict_mode)
+        manifest_errors, manifest_warnings = self._validate_manifest(plugin_path, manifest, strict_mode)
         errors.extend(manifest_errors)
         warnings.extend(manifest_warnings)
         
+        # One walk of the plugin tree feeds both the structure and the syntax checks
+        root_names, python_files = _scan_plugin(plugin_path)
+        
         # Validate code structure
-        code_errors, code_warnings = self._validate_code_structure(plugin_path, strict_mode)
+        code_errors, code_warnings = self._validate_code_structure(root_names, strict_mode)
         errors.extend(code_errors)
         warnings.extend(code_warnings)
         
         # Validate Python syntax
-        syntax_errors = self._validate_python_syntax(plugin_path)
+        syntax_errors = self._validate_python_syntax(plugin_path, python_files)
         errors.extend(syntax_errors)
         
         # Print results
@@ -54,26 +166,25 @@ class ValidateCommand(BaseCommand):
         
         return 1 if errors else 0
     
-    def _validate_manifest(self, path: str, strict: bool) -> tuple[List[str], List[str]]:
+    def _validate_manifest(self, path: str, manifest: Optional[Dict[str, Any]],
+                           strict: bool) -> tuple[List[str], List[str]]:
         """Validate plugin manifest"""
         errors = []
         warnings = []
         
-        manifest = self.load_manifest(path)
         if not manifest:
             errors.append("No valid plugin manifest found (plugin.yaml/plugin.json)")
             return errors, warnings
         
         # Required fields
-        required_fields = ["name", "type", "version", "entrypoint", "main_class"]
-        for field in required_fields:
-            if field not in manifest:
-                errors.append(f"Missing required field in manifest: {field}")
+        errors.extend(
+            f"Missing required field in manifest: {field}"
+            for field in _REQUIRED_MANIFEST_FIELDS if field not in manifest
+        )
         
         # Validate plugin type
-        valid_types = ["datasource", "vectordb", "llm", "utility"]
-        if "type" in manifest and manifest["type"] not in valid_types:
-            errors.append(f"Invalid plugin type: {manifest['type']}. Must be one of: {valid_types}")
+        if "type" in manifest and manifest["type"] not in _VALID_PLUGIN_TYPE_SET:
+            errors.append(f"Invalid plugin type: {manifest['type']}. Must be one of: {list(_VALID_PLUGIN_TYPES)}")
         
         # Validate version format
         if "version" in manifest:
@@ -88,69 +199,79 @@ class ValidateCommand(BaseCommand):
         
         # Strict mode validations
         if strict:
-            recommended_fields = ["description", "author", "license", "config_schema"]
-            for field in recommended_fields:
-                if field not in manifest:
-                    warnings.append(f"Recommended field missing from manifest: {field}")
+            warnings.extend(
+                f"Recommended field missing from manifest: {field}"
+                for field in _RECOMMENDED_MANIFEST_FIELDS if field not in manifest
+            )
         
         return errors, warnings
     
-    def _validate_code_structure(self, path: str, strict: bool) -> tuple[List[str], List[str]]:
-        """Validate plugin code structure"""
+    def _validate_code_structure(self, root_names: Set[str], strict: bool) -> tuple[List[str], List[str]]:
+        """Validate plugin code structure against the names found at the plugin root"""
         errors = []
         warnings = []
         
-        plugin_dir = Path(path)
-        
         # Check for required directories
         required_dirs = ["src"]
         for dir_name in required_dirs:
-            if not (plugin_dir / dir_name).exists():
+            if dir_name not in root_names:
                 errors.append(f"Required directory missing: {dir_name}")
         
         # Check for recommended files
         recommended_files = ["README.md", "requirements.txt", "setup.py"]
         for file_name in recommended_files:
-            if not (plugin_dir / file_name).exists():
+            if file_name not in root_names:
                 warnings.append(f"Recommended file missing: {file_name}")
         
         # Check for test directory (strict mode)
-        if strict and not (plugin_dir / "tests").exists():
+        if strict and "tests" not in root_names:
             warnings.append("Test directory missing (recommended for production plugins)")
         
         return errors, warnings
     
-    def _validate_python_syntax(self, path: str) -> List[str]:
-        """Validate Python syntax in plugin files"""
-        errors = []
+    def _validate_python_syntax(self, path: str,
+                                python_files: List[Tuple[Path, Optional[os.stat_result]]]) -> List[str]:
+        """Validate Python syntax in plugin files, given as (path, stat) pairs from _scan_plugin"""
+        cache_path = _syntax_cache_path(path)
+        cache = _load_syntax_cache(cache_path)
+        passed = {}
         
-        plugin_dir = Path(path)
-        python_files = list(plugin_dir.rglob("*.py"))
+        # Skip files whose signature matches one that already passed
+        to_check = []
+        signatures = []
+        for py_file, st in python_files:
+            signature = [st.st_mtime_ns, st.st_size, st.st_ino] if st is not None else None
+            key = str(py_file)
+            if signature is not None and cache.get(key) == signature:
+                passed[key] = signature
+            else:
+                to_check.append(py_file)
+                signatures.append(signature)
         
-        for py_file in python_files:
-            try:
-                with open(py_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                # Parse the Python code
-                ast.parse(content)
-                
-                # Additional checks
-                if "class" not in content and py_file.name.endswith("_plugin.py"):
-                    errors.append(f"No class definition found in main plugin file: {py_file}")
-                
-            except SyntaxError as e:
-                errors.append(f"Syntax error in {py_file}: {e}")
-            except Exception as e:
-                errors.append(f"Error reading {py_file}: {e}")
+        # Parsing is CPU-bound; only large trees are worth the process start-up cost
+        if len(to_check) > _PARALLEL_PARSE_THRESHOLD:
+            # Imported here: the process pool machinery is slow to import and rarely needed
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor() as executor:
+                results = list(executor.map(_check_python_file, to_check, chunksize=8))
+        else:
+            results = [_check_python_file(py_file) for py_file in to_check]
+        
+        errors = []
+        for py_file, signature, file_errors in zip(to_check, signatures, results):
+            if file_errors:
+                errors.extend(file_errors)
+            elif signature is not None:
+                passed[str(py_file)] = signature
+        
+        if passed != cache:
+            _save_syntax_cache(cache_path, passed)
         
         return errors
     
     def _is_valid_version(self, version: str) -> bool:
         """Check if version follows semantic versioning"""
-        import re
-        pattern = r'^\d+\.\d+\.\d+(-[a-zA-Z0-9]+)?$'
-        return bool(re.match(pattern, version))
+        return _SEMVER_RE.match(version) is not None
     
     def _validate_plugin_class(self, path: str, manifest: Dict[str, Any]) -> List[str]:
         """Validate that the main plugin class exists and is properly structured"""
@@ -160,6 +281,8 @@ class ValidateCommand(BaseCommand):
             return errors
         
         try:
+            import importlib.util
+            
             entrypoint_path = Path(path) / manifest["entrypoint"]
             spec = importlib.util.spec_from_file_location("plugin_module", entrypoint_path)
             
@@ -174,9 +297,7 @@ class ValidateCommand(BaseCommand):
                 else:
                     # Check if class has required methods
                     plugin_class = getattr(module, main_class_name)
-                    required_methods = ["validate_config", "initialize"]
-                    
-                    for method in required_methods:
+                    for method in _REQUIRED_CLASS_METHODS:
                         if not hasattr(plugin_class, method):
                             errors.append(f"Required method '{method}' missing from class {main_class_name}")
         
@@ -4,18 +4,27 @@ RAG Plugin CLI - Command line tool for plugin development
 """
 
 import argparse
+import functools
 import sys
 import os
 from pathlib import Path
-import json
-import yaml
 from typing import Dict, Any, Optional
 
 try:
-    from .commands import InitCommand, ValidateCommand, TestCommand, BuildCommand, DevServerCommand, FrameworkCommand
+    from . import commands
 except ImportError:
     # Fallback for direct execution
-    from commands import InitCommand, ValidateCommand, TestCommand, BuildCommand, DevServerCommand, FrameworkCommand
+    import commands
+
+# CLI command -> class in the commands package, imported only when that command runs
+_COMMAND_CLASSES = {
+    'init': 'InitCommand',
+    'validate': 'ValidateCommand',
+    'test': 'TestCommand',
+    'build': 'BuildCommand',
+    'dev-server': 'DevServerCommand',
+    'framework': 'FrameworkCommand'
+}
 
 
 class PluginCLI:
@@ -23,17 +32,12 @@ class PluginCLI:
     
     def __init__(self):
         self.parser = self._create_parser()
-        self.commands = {
-            'init': InitCommand(),
-            'validate': ValidateCommand(),
-            'test': TestCommand(),
-            'build': BuildCommand(),
-            'dev-server': DevServerCommand(),
-            'framework': FrameworkCommand()
-        }
+        self.commands = {}  # Instantiated on first use by _get_command
     
-    def _create_parser(self) -> argparse.ArgumentParser:
-        """Create the main argument parser"""
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _create_parser() -> argparse.ArgumentParser:
+        """Create the main argument parser (built once per process and shared)"""
         parser = argparse.ArgumentParser(
             prog='rag-plugin',
             description='RAG Plugin Development CLI',
@@ -136,10 +140,15 @@ Examples:
         )
         build_parser.add_argument(
             '--format',
-            choices=['zip', 'tar.gz'],
+            choices=['zip', 'tar.gz', 'tar.zst'],
             default='zip',
             help='Package format'
         )
+        build_parser.add_argument(
+            '--no-cache',
+            action='store_true',
+            help='Rebuild even if the package inputs are unchanged'
+        )
         
         # Dev server command
         dev_parser = subparsers.add_parser(
@@ -168,7 +177,7 @@ Examples:
             'action',
             nargs='?',
             default='status',
-            choices=['status', 'test', 'metrics', 'plugins', 'capabilities'],
+            choices=['status', 'test', 'metrics', 'plugins', 'capabilities', 'all'],
             help='Action to perform'
         )
         
@@ -183,7 +192,7 @@ Examples:
                 self.parser.print_help()
                 return 0
             
-            command = self.commands.get(parsed_args.command)
+            command = self._get_command(parsed_args.command)
             if not command:
                 print(f"Error: Unknown command '{parsed_args.command}'")
                 return 1
@@ -197,30 +206,24 @@ Examples:
             print(f"Error: {str(e)}")
             return 1
     
+    def _get_command(self, name: str):
+        """Import and instantiate a command the first time it is used"""
+        command = self.commands.get(name)
+        if command is None and name in _COMMAND_CLASSES:
+            command = self.commands[name] = getattr(commands, _COMMAND_CLASSES[name])()
+        return command
+    
     def get_plugin_info(self, path: str = ".") -> Optional[Dict[str, Any]]:
         """Get plugin information from manifest"""
-        manifest_file = self._find_manifest_file(path)
-        if not manifest_file:
-            return None
-        
         try:
-            with open(manifest_file, 'r') as f:
-                if manifest_file.suffix in ['.yaml', '.yml']:
-                    return yaml.safe_load(f)
-                else:
-                    return json.load(f)
+            # Deferred so --help/--version do not pay for the manifest parsers
+            try:
+                from .commands.base_command import find_and_load_manifest
+            except ImportError:
+                from commands.base_command import find_and_load_manifest
+            return find_and_load_manifest(path)
         except Exception:
             return None
-    
-    def _find_manifest_file(self, path: str) -> Optional[Path]:
-        """Find plugin manifest file"""
-        plugin_dir = Path(path)
-        for filename in ['plugin.yaml', 'plugin.yml', 'plugin.json']:
-            manifest_path = plugin_dir / filename
-            if manifest_path.exists():
-                return manifest_path
-        return None
-
 
 def main():
     """Main entry point for CLI"""
@@ -2,30 +2,13 @@
 Plugin Code Templates
 """
 
+import functools
+import string
 from typing import Dict, Any
 
-
-class PluginTemplates:
-    """Generate plugin code templates"""
-    
-    def get_main_template(self, plugin_type: str, name: str, template_type: str = "basic") -> str:
-        """Get main plugin file template"""
-        class_name = self._to_pascal_case(name)
-        
-        if plugin_type == "datasource":
-            return self._get_datasource_template(class_name)
-        elif plugin_type == "vectordb":
-            return self._get_vectordb_template(class_name)
-        elif plugin_type == "llm":
-            return self._get_llm_template(class_name)
-        elif plugin_type == "utility":
-            return self._get_utility_template(class_name)
-        else:
-            return self._get_base_template(class_name)
-    
-    def _get_datasource_template(self, class_name: str) -> str:
-        return f'''"""
-{class_name} DataSource Plugin
+# Main plugin modules by type, parsed once at import; ${class_name} is the only placeholder
+_DATASOURCE_TEMPLATE = string.Template('''"""
+${class_name} DataSource Plugin
 """
 
 import logging
@@ -34,8 +17,10 @@ from rag_builder_sdk import BaseDataSourcePlugin
 
 logger = logging.getLogger(__name__)
 
+_REQUIRED_FIELDS = frozenset(("connection_string", "table_name"))
+
 
-class {class_name}Plugin(BaseDataSourcePlugin):
+class ${class_name}Plugin(BaseDataSourcePlugin):
     """Custom DataSource plugin for RAG Builder"""
     
     def __init__(self, config: Dict[str, Any]):
@@ -44,22 +29,21 @@ class {class_name}Plugin(BaseDataSourcePlugin):
     
     async def validate_config(self, config: Dict[str, Any]) -> bool:
         """Validate plugin configuration"""
-        required_fields = ["connection_string", "table_name"]
-        return all(field in config and config[field] for field in required_fields)
+        return all(config.get(field) for field in _REQUIRED_FIELDS)
     
     async def initialize(self) -> bool:
         """Initialize the data source connection"""
         try:
             # TODO: Implement your connection logic here
             connection_string = self.config["connection_string"]
-            logger.info(f"Connecting to data source: {{connection_string}}")
+            logger.info(f"Connecting to data source: {connection_string}")
             
             # Example: self.connection = create_connection(connection_string)
             self.initialized = True
             return True
             
         except Exception as e:
-            logger.error(f"Failed to initialize data source: {{e}}")
+            logger.error(f"Failed to initialize data source: {e}")
             return False
     
     async def get_documents(self) -> List[Dict[str, Any]]:
@@ -70,21 +54,21 @@ class {class_name}Plugin(BaseDataSourcePlugin):
         try:
             # TODO: Implement your document retrieval logic here
             table_name = self.config["table_name"]
-            logger.info(f"Retrieving documents from table: {{table_name}}")
+            logger.info(f"Retrieving documents from table: {table_name}")
             
             # Example implementation:
             documents = [
-                {{
+                {
                     "id": "doc_1",
                     "content": "Sample document content",
-                    "metadata": {{"source": table_name}}
-                }}
+                    "metadata": {"source": table_name}
+                }
             ]
             
             return documents
             
         except Exception as e:
-            logger.error(f"Failed to retrieve documents: {{e}}")
+            logger.error(f"Failed to retrieve documents: {e}")
             raise
     
     async def cleanup(self):
@@ -96,14 +80,13 @@ class {class_name}Plugin(BaseDataSourcePlugin):
 
 
 # Plugin factory function
-def create_plugin(config: Dict[str, Any]) -> {class_name}Plugin:
+def create_plugin(config: Dict[str, Any]) -> ${class_name}Plugin:
     """Create plugin instance"""
-    return {class_name}Plugin(config)
-'''
-    
-    def _get_vectordb_template(self, class_name: str) -> str:
-        return f'''"""
-{class_name} VectorDB Plugin
+    return ${class_name}Plugin(config)
+''')
+
+_VECTORDB_TEMPLATE = string.Template('''"""
+${class_name} VectorDB Plugin
 """
 
 import logging
@@ -112,8 +95,10 @@ from rag_builder_sdk import BaseVectorDBPlugin
 
 logger = logging.getLogger(__name__)
 
+_REQUIRED_FIELDS = frozenset(("collection_name", "dimension"))
+
 
-class {class_name}Plugin(BaseVectorDBPlugin):
+class ${class_name}Plugin(BaseVectorDBPlugin):
     """Custom VectorDB plugin for RAG Builder"""
     
     def __init__(self, config: Dict[str, Any]):
@@ -123,8 +108,7 @@ class {class_name}Plugin(BaseVectorDBPlugin):
     
     async def validate_config(self, config: Dict[str, Any]) -> bool:
         """Validate plugin configuration"""
-        required_fields = ["collection_name", "dimension"]
-        return all(field in config and config[field] for field in required_fields)
+        return all(config.get(field) for field in _REQUIRED_FIELDS)
     
     async def initialize(self) -> bool:
         """Initialize the vector database connection"""
@@ -133,7 +117,7 @@ class {class_name}Plugin(BaseVectorDBPlugin):
             collection_name = self.config["collection_name"]
             dimension = self.config["dimension"]
             
-            logger.info(f"Initializing vector collection: {{collection_name}} (dim={{dimension}})")
+            logger.info(f"Initializing vector collection: {collection_name} (dim={dimension})")
             
             # Example: self.client = create_client()
             # Example: self.collection = self.client.get_collection(collection_name)
@@ -142,7 +126,7 @@ class {class_name}Plugin(BaseVectorDBPlugin):
             return True
             
         except Exception as e:
-            logger.error(f"Failed to initialize vector database: {{e}}")
+            logger.error(f"Failed to initialize vector database: {e}")
             return False
     
     async def store_vectors(self, documents: List[Dict[str, Any]], embeddings: List[List[float]]) -> bool:
@@ -152,7 +136,7 @@ class {class_name}Plugin(BaseVectorDBPlugin):
         
         try:
             # TODO: Implement your vector storage logic here
-            logger.info(f"Storing {{len(documents)}} vectors")
+            logger.info(f"Storing {len(documents)} vectors")
             
             # Example implementation:
             for doc, embedding in zip(documents, embeddings):
@@ -162,7 +146,7 @@ class {class_name}Plugin(BaseVectorDBPlugin):
             return True
             
         except Exception as e:
-            logger.error(f"Failed to store vectors: {{e}}")
+            logger.error(f"Failed to store vectors: {e}")
             return False
     
     async def query_vectors(self, query_vector: List[float], top_k: int = 5) -> List[Dict[str, Any]]:
@@ -172,22 +156,22 @@ class {class_name}Plugin(BaseVectorDBPlugin):
         
         try:
             # TODO: Implement your vector query logic here
-            logger.info(f"Querying vectors (top_k={{top_k}})")
+            logger.info(f"Querying vectors (top_k={top_k})")
             
             # Example implementation:
             results = [
-                {{
+                {
                     "id": "result_1",
                     "content": "Similar document content",
                     "score": 0.95,
-                    "metadata": {{"source": "vector_db"}}
-                }}
+                    "metadata": {"source": "vector_db"}
+                }
             ]
             
             return results
             
         except Exception as e:
-            logger.error(f"Failed to query vectors: {{e}}")
+            logger.error(f"Failed to query vectors: {e}")
             raise
     
     async def cleanup(self):
@@ -199,14 +183,13 @@ class {class_name}Plugin(BaseVectorDBPlugin):
 
 
 # Plugin factory function
-def create_plugin(config: Dict[str, Any]) -> {class_name}Plugin:
+def create_plugin(config: Dict[str, Any]) -> ${class_name}Plugin:
     """Create plugin instance"""
-    return {class_name}Plugin(config)
-'''
-    
-    def _get_llm_template(self, class_name: str) -> str:
-        return f'''"""
-{class_name} LLM Plugin
+    return ${class_name}Plugin(config)
+''')
+
+_LLM_TEMPLATE = string.Template('''"""
+${class_name} LLM Plugin
 """
 
 import logging
@@ -215,8 +198,10 @@ from rag_builder_sdk import BaseLLMPlugin
 
 logger = logging.getLogger(__name__)
 
+_REQUIRED_FIELDS = frozenset(("api_key", "model"))
+
 
-class {class_name}Plugin(BaseLLMPlugin):
+class ${class_name}Plugin(BaseLLMPlugin):
     """Custom LLM plugin for RAG Builder"""
     
     def __init__(self, config: Dict[str, Any]):
@@ -225,8 +210,7 @@ class {class_name}Plugin(BaseLLMPlugin):
     
     async def validate_config(self, config: Dict[str, Any]) -> bool:
         """Validate plugin configuration"""
-        required_fields = ["api_key", "model"]
-        return all(field in config and config[field] for field in required_fields)
+        return all(config.get(field) for field in _REQUIRED_FIELDS)
     
     async def initialize(self) -> bool:
         """Initialize the LLM client"""
@@ -235,7 +219,7 @@ class {class_name}Plugin(BaseLLMPlugin):
             api_key = self.config["api_key"]
             model = self.config["model"]
             
-            logger.info(f"Initializing LLM client with model: {{model}}")
+            logger.info(f"Initializing LLM client with model: {model}")
             
             # Example: self.client = create_llm_client(api_key)
             
@@ -243,7 +227,7 @@ class {class_name}Plugin(BaseLLMPlugin):
             return True
             
         except Exception as e:
-            logger.error(f"Failed to initialize LLM: {{e}}")
+            logger.error(f"Failed to initialize LLM: {e}")
             return False
     
     async def generate_response(self, prompt: str, context: str = "") -> str:
@@ -256,18 +240,18 @@ class {class_name}Plugin(BaseLLMPlugin):
             model = self.config["model"]
             temperature = self.config.get("temperature", 0.7)
             
-            logger.info(f"Generating response with model: {{model}}")
+            logger.info(f"Generating response with model: {model}")
             
             # Combine context and prompt
-            full_prompt = f"Context: {{context}}\\n\\nQuestion: {{prompt}}"
+            full_prompt = f"Context: {context}\\n\\nQuestion: {prompt}"
             
             # Example implementation:
-            response = f"Generated response for: {{prompt[:50]}}..."
+            response = f"Generated response for: {prompt[:50]}..."
             
             return response
             
         except Exception as e:
-            logger.error(f"Failed to generate response: {{e}}")
+            logger.error(f"Failed to generate response: {e}")
             raise
     
     async def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
@@ -277,7 +261,7 @@ class {class_name}Plugin(BaseLLMPlugin):
         
         try:
             # TODO: Implement your embedding generation logic here
-            logger.info(f"Generating embeddings for {{len(texts)}} texts")
+            logger.info(f"Generating embeddings for {len(texts)} texts")
             
             # Example implementation:
             embeddings = []
@@ -289,7 +273,7 @@ class {class_name}Plugin(BaseLLMPlugin):
             return embeddings
             
         except Exception as e:
-            logger.error(f"Failed to generate embeddings: {{e}}")
+            logger.error(f"Failed to generate embeddings: {e}")
             raise
     
     async def cleanup(self):
@@ -301,14 +285,13 @@ class {class_name}Plugin(BaseLLMPlugin):
 
 
 # Plugin factory function
-def create_plugin(config: Dict[str, Any]) -> {class_name}Plugin:
+def create_plugin(config: Dict[str, Any]) -> ${class_name}Plugin:
     """Create plugin instance"""
-    return {class_name}Plugin(config)
-'''
-    
-    def _get_utility_template(self, class_name: str) -> str:
-        return f'''"""
-{class_name} Utility Plugin
+    return ${class_name}Plugin(config)
+''')
+
+_UTILITY_TEMPLATE = string.Template('''"""
+${class_name} Utility Plugin
 """
 
 import logging
@@ -318,7 +301,7 @@ from rag_builder_sdk import BasePlugin
 logger = logging.getLogger(__name__)
 
 
-class {class_name}Plugin(BasePlugin):
+class ${class_name}Plugin(BasePlugin):
     """Custom Utility plugin for RAG Builder"""
     
     def __init__(self, config: Dict[str, Any]):
@@ -344,7 +327,7 @@ class {class_name}Plugin(BasePlugin):
             return True
             
         except Exception as e:
-            logger.error(f"Failed to initialize utility: {{e}}")
+            logger.error(f"Failed to initialize utility: {e}")
             return False
     
     async def process_data(self, data: Any) -> Any:
@@ -362,7 +345,7 @@ class {class_name}Plugin(BasePlugin):
             return processed_data
             
         except Exception as e:
-            logger.error(f"Failed to process data: {{e}}")
+            logger.error(f"Failed to process data: {e}")
             raise
     
     async def cleanup(self):
@@ -371,14 +354,13 @@ class {class_name}Plugin(BasePlugin):
 
 
 # Plugin factory function
-def create_plugin(config: Dict[str, Any]) -> {class_name}Plugin:
+def create_plugin(config: Dict[str, Any]) -> ${class_name}Plugin:
     """Create plugin instance"""
-    return {class_name}Plugin(config)
-'''
-    
-    def _get_base_template(self, class_name: str) -> str:
-        return f'''"""
-{class_name} Plugin
+    return ${class_name}Plugin(config)
+''')
+
+_BASE_TEMPLATE = string.Template('''"""
+${class_name} Plugin
 """
 
 import logging
@@ -388,7 +370,7 @@ from rag_builder_sdk import BasePlugin
 logger = logging.getLogger(__name__)
 
 
-class {class_name}Plugin(BasePlugin):
+class ${class_name}Plugin(BasePlugin):
     """Custom plugin for RAG Builder"""
     
     def __init__(self, config: Dict[str, Any]):
@@ -409,7 +391,7 @@ class {class_name}Plugin(BasePlugin):
             return True
             
         except Exception as e:
-            logger.error(f"Failed to initialize plugin: {{e}}")
+            logger.error(f"Failed to initialize plugin: {e}")
             return False
     
     async def cleanup(self):
@@ -418,14 +400,46 @@ class {class_name}Plugin(BasePlugin):
 
 
 # Plugin factory function
-def create_plugin(config: Dict[str, Any]) -> {class_name}Plugin:
+def create_plugin(config: Dict[str, Any]) -> ${class_name}Plugin:
     """Create plugin instance"""
-    return {class_name}Plugin(config)
-'''
+    return ${class_name}Plugin(config)
+''')
+
+
+# Plugin type -> main template; unknown types get _BASE_TEMPLATE
+_MAIN_TEMPLATES = {
+    "datasource": _DATASOURCE_TEMPLATE,
+    "vectordb": _VECTORDB_TEMPLATE,
+    "llm": _LLM_TEMPLATE,
+    "utility": _UTILITY_TEMPLATE,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _to_pascal_case(snake_str: str) -> str:
+    """Convert snake_case or kebab-case to PascalCase"""
+    return ''.join(word.capitalize() for word in snake_str.replace('-', '_').split('_'))
+
+
+class PluginTemplates:
+    """Generate plugin code templates
+
+    Every template is a pure function of its arguments, so the public getters are
+    memoized static methods shared by all instances.
+    """
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def get_main_template(plugin_type: str, name: str, template_type: str = "basic") -> str:
+        """Get main plugin file template"""
+        template = _MAIN_TEMPLATES.get(plugin_type, _BASE_TEMPLATE)
+        return template.substitute(class_name=_to_pascal_case(name))
     
-    def get_init_template(self, name: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def get_init_template(name: str) -> str:
         """Get __init__.py template"""
-        class_name = self._to_pascal_case(name)
+        class_name = _to_pascal_case(name)
         return f'''"""
 {name.replace("-", " ").title()} Plugin Package
 """
@@ -436,9 +450,11 @@ __version__ = "1.0.0"
 __all__ = ["{class_name}Plugin", "create_plugin"]
 '''
     
-    def get_test_template(self, plugin_type: str, name: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def get_test_template(plugin_type: str, name: str) -> str:
         """Get test file template"""
-        class_name = self._to_pascal_case(name)
+        class_name = _to_pascal_case(name)
         return f'''"""
 Tests for {class_name} Plugin
 """
@@ -483,7 +499,9 @@ class Test{class_name}Plugin:
     # TODO: Add more specific tests for your plugin type
 '''
     
-    def get_requirements_template(self, plugin_type: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def get_requirements_template(plugin_type: str) -> str:
         """Get requirements.txt template"""
         base_requirements = ["rag-builder-sdk>=1.0.0"]
         
@@ -494,10 +512,13 @@ class Test{class_name}Plugin:
             "utility": []
         }
         
-        requirements = base_requirements + type_requirements.get(plugin_type, [])
-        return "\\n".join(requirements) + "\\n"
+        # The trailing empty entry gives the file its final newline in the same join
+        lines = base_requirements + type_requirements.get(plugin_type, []) + [""]
+        return "\n".join(lines)
     
-    def get_readme_template(self, name: str, plugin_type: str, description: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def get_readme_template(name: str, plugin_type: str, description: str) -> str:
         """Get README.md template"""
         title = name.replace("-", " ").title()
         return f'''# {title}
@@ -554,9 +575,11 @@ rag-plugin build
 MIT License
 '''
     
-    def get_setup_template(self, name: str, plugin_type: str, author: str, description: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def get_setup_template(name: str, plugin_type: str, author: str, description: str) -> str:
         """Get setup.py template"""
-        class_name = self._to_pascal_case(name)
+        class_name = _to_pascal_case(name)
         return f'''"""
 Setup script for {name} plugin
 """
@@ -590,7 +613,3 @@ setup(
     }}
 )
 '''
-    
-    def _to_pascal_case(self, snake_str: str) -> str:
-        """Convert snake_case or kebab-case to PascalCase"""
-        return ''.join(word.capitalize() for word in snake_str.replace('-', '_').split('_'))
\ No newline at end of file
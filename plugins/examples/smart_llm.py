@@ -7,6 +7,8 @@ from typing import List, Dict, Any
 import hashlib
 import random
 
+_EMBEDDING_DIMENSION = 384
+
 
 class SmartLLMPlugin(LLMPlugin):
     """Example LLM plugin with smart features"""
@@ -41,11 +43,11 @@ class SmartLLMPlugin(LLMPlugin):
         """Generate embeddings for texts"""
         embeddings = []
         for text in texts:
-            # Mock embedding generation
-            seed = abs(hash(text)) % (10**8)
-            random.seed(seed)
-            embedding = [random.random() for _ in range(384)]
-            embeddings.append(embedding)
+            # Mock embedding generation: a private RNG seeded from a stable digest, so the
+            # global random state is untouched and a text maps to the same vector in every process
+            seed = int.from_bytes(hashlib.blake2b(text.encode(), digest_size=8).digest(), "little")
+            next_value = random.Random(seed).random
+            embeddings.append([next_value() for _ in range(_EMBEDDING_DIMENSION)])
         return embeddings
     
     @capability("Get model statistics")
@@ -5,6 +5,8 @@ Example: Text Processing Plugin - No manifest needed, just Python
 import re
 from typing import Dict, List, Any
 
+_EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+
 
 def clean_text(text: str) -> str:
     """Remove extra whitespace and normalize text"""
@@ -18,18 +20,18 @@ def count_words(text: str) -> int:
 
 def extract_emails(text: str) -> List[str]:
     """Extract email addresses from text"""
-    pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    return re.findall(pattern, text)
+    return _EMAIL_PATTERN.findall(text)
 
 
 def analyze_text(text: str) -> Dict[str, Any]:
     """Comprehensive text analysis"""
+    words = text.split()  # shared by word_count and cleaned_text
     return {
-        "word_count": count_words(text),
+        "word_count": len(words),
         "char_count": len(text),
         "line_count": text.count('\n') + 1,
         "emails": extract_emails(text),
-        "cleaned_text": clean_text(text)
+        "cleaned_text": ' '.join(words)
     }
 
 
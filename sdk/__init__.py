@@ -8,7 +8,8 @@ from pathlib import Path
 
 # Add backend to path
 backend_path = Path(__file__).parent.parent / "backend"
-sys.path.insert(0, str(backend_path))
+if str(backend_path) not in sys.path:
+    sys.path.insert(0, str(backend_path))
 
 # Import from core framework
 from core import (
@@ -6,6 +6,8 @@ from abc import abstractmethod
 from typing import Dict, List, Any, Optional, AsyncIterator
 from .base_plugin import BasePlugin
 
+_REQUIRED_DOCUMENT_FIELDS = frozenset(("id", "content"))
+
 
 class BaseDataSourcePlugin(BasePlugin):
     """Base class for data source plugins"""
@@ -80,8 +82,7 @@ class BaseDataSourcePlugin(BasePlugin):
         Returns:
             bool: True if document format is valid
         """
-        required_fields = ["id", "content"]
-        return all(field in document for field in required_fields)
+        return _REQUIRED_DOCUMENT_FIELDS.issubset(document.keys())
     
     async def test_connection(self) -> bool:
         """Test data source connection"""
@@ -15,6 +15,9 @@ setup(
         "pytest>=7.0",
         "pytest-asyncio>=0.21.0",
     ],
+    extras_require={
+        "zstd": ["zstandard>=0.21.0"],
+    },
     entry_points={
         "console_scripts": [
             "rag-plugin=cli.rag_plugin_cli:main",
@@ -0,0 +1,11 @@
+"""
+Shared test setup
+"""
+
+import sys
+from pathlib import Path
+
+# Make the backend and cli packages importable from the repository root
+_REPO_ROOT = str(Path(__file__).parent.parent)
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
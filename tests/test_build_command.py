@@ -0,0 +1,67 @@
+"""
+Tests for the build command's package cache
+"""
+
+import zipfile
+
+import pytest
+
+from cli.commands.build_command import BuildCommand
+from cli.rag_plugin_cli import PluginCLI
+
+
+@pytest.fixture
+def plugin_dir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    assert PluginCLI().run(["init", "demo-plugin", "--type", "utility"]) == 0
+    path = tmp_path / "demo-plugin"
+    monkeypatch.chdir(path)
+    return path
+
+
+def test_unchanged_inputs_reuse_package(plugin_dir, capsys):
+    assert PluginCLI().run(["build"]) == 0
+    capsys.readouterr()
+
+    assert PluginCLI().run(["build"]) == 0
+    assert "reusing existing package" in capsys.readouterr().out
+
+
+def test_interrupted_build_is_not_reused(plugin_dir, monkeypatch, capsys):
+    assert PluginCLI().run(["build"]) == 0
+    package = plugin_dir / "dist" / "demo-plugin-1.0.0.zip"
+
+    # Inputs unchanged, but the rewrite dies after truncating the archive
+    def interrupted(self, package_path, files):
+        package_path.write_bytes(b"truncated")
+        raise RuntimeError("killed")
+
+    monkeypatch.setattr(BuildCommand, "_create_zip_package", interrupted)
+    assert PluginCLI().run(["build", "--no-cache"]) == 1
+    monkeypatch.undo()
+    monkeypatch.chdir(plugin_dir)
+    capsys.readouterr()
+
+    assert PluginCLI().run(["build"]) == 0
+    assert "reusing existing package" not in capsys.readouterr().out
+    assert zipfile.is_zipfile(package)
+
+
+_EXCLUDES = ["**/__pycache__/**", "**/*.pyc", "**/tests/**"]
+
+
+def test_root_level_entries_are_not_excluded_by_nested_patterns(tmp_path):
+    for relative in ["foo.pyc", "__pycache__/a.pyc", "tests/test_x.py",
+                     "src/mod.py", "src/bar.pyc", "src/__pycache__/b.pyc", "src/tests/t.py"]:
+        (tmp_path / relative).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / relative).write_text("")
+
+    collect = BuildCommand()._collect_files
+
+    # "**/" needs a parent directory, matching fnmatch on the relative path
+    assert [arcname for _, arcname, _ in collect(tmp_path, ["**/*"], _EXCLUDES)] == [
+        "foo.pyc", "src/mod.py", "tests/test_x.py",
+    ]
+    assert [arcname for _, arcname, _ in collect(tmp_path, ["foo.pyc", "src/bar.pyc"], _EXCLUDES)] == [
+        "foo.pyc",
+    ]
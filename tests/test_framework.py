@@ -0,0 +1,60 @@
+"""
+Tests for the Framework capability registry
+"""
+
+import asyncio
+
+from backend.core.framework import Framework, Plugin
+
+
+def _plugin(plugin_id: str) -> Plugin:
+    plugin = Plugin(plugin_id)
+    plugin.provide("echo")(lambda value: f"{plugin_id}:{value}")
+    return plugin
+
+
+def _framework(*plugin_ids: str) -> Framework:
+    framework = Framework()
+    for plugin_id in plugin_ids:
+        framework.register_plugin(_plugin(plugin_id))
+    return framework
+
+
+def test_list_capabilities_returns_independent_copies():
+    framework = _framework("a", "b")
+
+    caps = framework.list_capabilities()
+    caps["echo"].append("intruder")
+    caps.pop("echo")
+
+    assert framework.list_capabilities() == {"echo": ["a", "b"]}
+    assert framework.global_capabilities == {"echo": ["a", "b"]}
+
+
+def test_discover_capability_providers_returns_a_copy():
+    framework = _framework("a")
+
+    framework.discover_capability_providers("echo").clear()
+
+    assert [p["plugin_id"] for p in framework.discover_capability_providers("echo")] == ["a"]
+
+
+def test_call_capability_dispatches_through_execute_capability():
+    class AuditedPlugin(Plugin):
+        async def execute_capability(self, capability_name, *args, **kwargs):
+            result = await super().execute_capability(capability_name, *args, **kwargs)
+            return f"audited {result}"
+
+    plugin = AuditedPlugin("audited")
+    plugin.provide("echo")(lambda value: f"audited:{value}")
+    framework = Framework()
+    framework.register_plugin(plugin)
+
+    assert asyncio.run(framework.call_capability("echo", 1, use_cache=False)) == "audited audited:1"
+
+
+def test_call_capability_sees_capabilities_replaced_after_registration():
+    framework = _framework("a")
+    framework.plugins["a"].provide("echo")(lambda value: f"replaced:{value}")
+
+    assert asyncio.run(framework.call_capability("echo", 1, use_cache=False)) == "replaced:1"
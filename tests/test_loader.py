@@ -0,0 +1,107 @@
+"""
+Tests for plugin discovery in the Loader
+"""
+
+import asyncio
+import sys
+import threading
+import types
+
+import pytest
+
+from backend.core.framework import Framework
+from backend.core.loader import Loader
+
+_FILE_PLUGIN = '''
+import asyncio
+import loader_probe
+from backend.core import QuickPlugin, capability
+
+# Top-level code that only works on the event loop thread
+asyncio.get_event_loop()
+loader_probe.record(__name__)
+
+
+class {name}Plugin(QuickPlugin):
+    def __init__(self, plugin_id: str = "{name}", config: dict = None):
+        super().__init__(plugin_id, config)
+
+    @capability("Shared capability")
+    def shared(self) -> str:
+        return "{name}"
+
+    @capability("Own capability")
+    def only_{name}(self) -> str:
+        return "{name}"
+'''
+
+_MANIFEST = '''name: Gamma
+entrypoint: plugin.py
+main_class: gammaPlugin
+'''
+
+
+@pytest.fixture
+def plugins_dir(tmp_path, monkeypatch):
+    probe = types.ModuleType("loader_probe")
+    probe.calls = []
+    probe.record = lambda name: probe.calls.append((name, threading.get_ident()))
+    monkeypatch.setitem(sys.modules, "loader_probe", probe)
+
+    plugins = tmp_path / "plugins"
+    plugins.mkdir()
+    (plugins / "probe_alpha.py").write_text(_FILE_PLUGIN.format(name="alpha"))
+    (plugins / "probe_beta.py").write_text(_FILE_PLUGIN.format(name="beta"))
+    (plugins / "probe_gamma").mkdir()
+    (plugins / "probe_gamma" / "plugin.yaml").write_text(_MANIFEST)
+    (plugins / "probe_gamma" / "plugin.py").write_text(_FILE_PLUGIN.format(name="gamma"))
+
+    yield plugins
+
+    for name in ("probe_alpha", "probe_beta", "probe_gamma"):
+        sys.modules.pop(name, None)
+
+
+def _registry(framework: Framework):
+    return (
+        list(framework.plugins),
+        {name: list(providers) for name, providers in framework.global_capabilities.items()},
+    )
+
+
+async def _load_sequentially(plugins_dir) -> Framework:
+    framework = Framework()
+    loader = Loader(framework, str(plugins_dir))
+    for item in loader._iter_plugin_paths():
+        if loader._is_plugin_candidate(item):
+            _, plugin = await loader._load_candidate(item)
+            if plugin:
+                await framework.load_plugin(plugin)
+    return framework
+
+
+async def _discover(plugins_dir):
+    framework = Framework()
+    results = await Loader(framework, str(plugins_dir)).discover_and_load_all()
+    return framework, results
+
+
+def test_discovery_matches_sequential_load(plugins_dir):
+    sequential = asyncio.run(_load_sequentially(plugins_dir))
+    discovered, results = asyncio.run(_discover(plugins_dir))
+
+    assert results and all(results.values())
+    assert _registry(discovered) == _registry(sequential)
+
+
+def test_plugin_modules_run_on_loop_thread_in_discovery_order(plugins_dir):
+    probe = sys.modules["loader_probe"]
+    loader = Loader(Framework(), str(plugins_dir))
+    expected = [loader._generate_plugin_id(item) for item in loader._iter_plugin_paths()
+                if loader._is_plugin_candidate(item)]
+
+    _, results = asyncio.run(_discover(plugins_dir))
+
+    assert all(results.values())
+    assert [name for name, _ in probe.calls] == expected
+    assert {thread for _, thread in probe.calls} == {threading.get_ident()}
@@ -0,0 +1,34 @@
+"""
+Tests for BasePlugin capability auto-registration
+"""
+
+import gc
+import weakref
+
+from backend.core.plugin_base import QuickPlugin
+
+
+def test_subclass_registers_its_own_methods():
+    class Parent(QuickPlugin):
+        def ping(self):
+            return "pong"
+
+    class Child(Parent):
+        def extra(self):
+            return "extra"
+
+    assert set(Parent("parent").capabilities) == {"ping"}
+    assert set(Child("child").capabilities) == {"ping", "extra"}
+
+
+def test_discarded_plugin_class_is_not_kept_alive():
+    class Reloadable(QuickPlugin):
+        def ping(self):
+            return "pong"
+
+    Reloadable("reloadable")
+    ref = weakref.ref(Reloadable)
+    del Reloadable
+    gc.collect()
+
+    assert ref() is None
@@ -0,0 +1,88 @@
+"""
+Tests for the test command's dependency install stamp
+"""
+
+import os
+
+import pytest
+
+from cli.commands import test_command
+
+
+class _FakePip:
+    """Stands in for the pip subprocess and counts installs"""
+
+    def __init__(self, returncode=0):
+        self.returncode = returncode
+        self.calls = []
+
+    def __call__(self, cmd, **kwargs):
+        self.calls.append(cmd)
+        return self
+
+    def __enter__(self):
+        self.stdout = iter(["pip output\n"])
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+@pytest.fixture
+def fake_pip(monkeypatch):
+    pip = _FakePip()
+    monkeypatch.setattr(test_command.subprocess, "Popen", pip)
+    return pip
+
+
+def test_install_skipped_while_requirements_unchanged(tmp_path, fake_pip):
+    (tmp_path / "requirements.txt").write_text("requests\n")
+    command = test_command.TestCommand()
+
+    command._install_plugin_requirements(tmp_path)
+    command._install_plugin_requirements(tmp_path)
+
+    assert len(fake_pip.calls) == 1
+    assert (tmp_path / test_command._DEPS_STAMP).exists()
+
+
+def test_install_reruns_after_requirements_change(tmp_path, fake_pip):
+    requirements = tmp_path / "requirements.txt"
+    requirements.write_text("requests\n")
+    command = test_command.TestCommand()
+    command._install_plugin_requirements(tmp_path)
+
+    # Same mtime, different contents
+    st = os.stat(requirements)
+    requirements.write_text("requests\nhttpx\n")
+    os.utime(requirements, ns=(st.st_atime_ns, st.st_mtime_ns))
+    command._install_plugin_requirements(tmp_path)
+
+    assert len(fake_pip.calls) == 2
+
+
+def test_install_reruns_for_another_interpreter(tmp_path, fake_pip, monkeypatch):
+    (tmp_path / "requirements.txt").write_text("requests\n")
+    command = test_command.TestCommand()
+    command._install_plugin_requirements(tmp_path)
+
+    monkeypatch.setattr(test_command.sys, "executable", "/other/venv/bin/python")
+    command._install_plugin_requirements(tmp_path)
+
+    assert len(fake_pip.calls) == 2
+    assert fake_pip.calls[-1][0] == "/other/venv/bin/python"
+
+
+def test_failed_install_leaves_no_stamp(tmp_path, fake_pip):
+    (tmp_path / "requirements.txt").write_text("requests\n")
+    fake_pip.returncode = 1
+
+    test_command.TestCommand()._install_plugin_requirements(tmp_path)
+
+    assert not (tmp_path / test_command._DEPS_STAMP).exists()
+
+
+def test_no_requirements_means_no_install(tmp_path, fake_pip):
+    test_command.TestCommand()._install_plugin_requirements(tmp_path)
+
+    assert fake_pip.calls == []
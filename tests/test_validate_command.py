@@ -0,0 +1,68 @@
+"""
+Tests for the validate command's syntax cache
+"""
+
+import os
+
+import pytest
+
+from cli.commands import validate_command
+from cli.commands.validate_command import ValidateCommand, _scan_plugin
+
+
+@pytest.fixture
+def checked(tmp_path, monkeypatch):
+    """Isolate the cache and record every file that actually gets parsed"""
+    monkeypatch.setattr(validate_command, "_SYNTAX_CACHE_DIR", tmp_path / "cache")
+    parsed = []
+    check = validate_command._check_python_file
+
+    def recording_check(py_file):
+        parsed.append(py_file.name)
+        return check(py_file)
+
+    monkeypatch.setattr(validate_command, "_check_python_file", recording_check)
+    return parsed
+
+
+@pytest.fixture
+def plugin(tmp_path):
+    src = tmp_path / "plugin" / "src"
+    src.mkdir(parents=True)
+    (src / "good.py").write_text("x = 1\n")
+    return tmp_path / "plugin"
+
+
+def _syntax_errors(path):
+    _, python_files = _scan_plugin(str(path))
+    return ValidateCommand()._validate_python_syntax(str(path), python_files)
+
+
+def test_unchanged_files_are_not_parsed_again(plugin, checked):
+    assert _syntax_errors(plugin) == []
+    assert _syntax_errors(plugin) == []
+
+    assert checked == ["good.py"]
+
+
+def test_modified_file_is_parsed_again(plugin, checked):
+    good = plugin / "src" / "good.py"
+    _syntax_errors(plugin)
+
+    good.write_text("x = 22\n")
+    st = os.stat(good)
+    os.utime(good, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    assert _syntax_errors(plugin) == []
+    assert checked == ["good.py", "good.py"]
+
+
+def test_files_with_errors_are_reported_every_run(plugin, checked):
+    (plugin / "src" / "bad.py").write_text("def (:\n")
+
+    first = _syntax_errors(plugin)
+    second = _syntax_errors(plugin)
+
+    assert len(first) == 1 and first == second
+    assert checked.count("bad.py") == 2
+    assert checked.count("good.py") == 1